@@ -0,0 +1,59 @@
+"""
+Benchmark of Parareal method against serial Runge-Kutta method.
+
+Usage:
+    python benchmarks/parareal.py [max number of workers]
+"""
+
+import os
+import sys
+import time
+from typing import Tuple
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from solution.parareal import Parareal  # noqa: E402
+from solution.vectorized_runge_kutta import VectorizedRungeKutta  # noqa: E402
+
+ACCURACY: float = 1e-8
+BORDERS = [1] + [0] * 9
+COEFFICIENTS = list(np.poly(-np.arange(1, 11) / 4)[::-1])
+FREE_ARGUMENT: float = 1
+LIMITS = -100, 100
+STEP: float = 0.0005
+
+
+def measure(solver: VectorizedRungeKutta) -> Tuple[float, np.ndarray]:
+    """
+    Function measures time to solve equation with given solver.
+    :param solver: solver.
+    :return: time in seconds and solution.
+    """
+
+    solver.set_data(COEFFICIENTS, FREE_ARGUMENT, BORDERS, LIMITS)
+    solver.set_accuracy(ACCURACY)
+    start = time.perf_counter()
+    _, variables = solver.solve_for_step(STEP)
+    return time.perf_counter() - start, variables
+
+
+def main():
+    max_number_of_workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count()
+    serial_time, serial_variables = measure(VectorizedRungeKutta())
+    print(f"Serial Runge-Kutta: {serial_time:.3f} s")
+    number_of_workers = 2
+    while number_of_workers <= max_number_of_workers:
+        parareal = Parareal()
+        parareal.set_number_of_workers(number_of_workers)
+        measure(parareal)
+        parareal_time, variables = measure(parareal)
+        parareal.shutdown_workers()
+        difference = np.max(np.abs(variables - serial_variables))
+        print(f"Parareal, {number_of_workers} workers: {parareal_time:.3f} s, speedup "
+              f"{serial_time / parareal_time:.2f}, max difference {difference:.2e}")
+        number_of_workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""
+Benchmark suite of solution methods and exports. Benchmark runs without
+display and saves results to JSON file, results of two runs can be compared to
+find regressions.
+
+Usage:
+    python benchmarks/suite.py run [-o results.json] [-m METHOD ...] [-k filter] [-r repeats] [-w workers]
+        [--orders 1 2 5] [--no-memory] [--no-export]
+    python benchmarks/suite.py compare old.json new.json [-t threshold]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from solution import ExactSolution, SolutionMethod, SolverCore  # noqa: E402
+from solution.export import save_solution  # noqa: E402
+
+ACCURACIES: Tuple[float, ...] = (1e-4, 1e-5, 1e-6)
+DEFAULT_BORDERS: List[float] = [0, 3, -9, -8, 0]
+DEFAULT_COEFFICIENTS: List[float] = [243, 405, 270, 90, 15, 1]
+DEFAULT_THRESHOLD: float = 0.1
+EXPORT_FORMATS: Tuple[str, ...] = ("csv", "npy", "npz", "txt", "xlsx")
+EXPORT_NUMBER_OF_POINTS: int = 200000
+METHODS: List[str] = [method.name for method in SolutionMethod if method != SolutionMethod.EULER]
+MIN_MEASURE_TIME: float = 0.2
+ORACLE_TOLERANCE: float = 100
+ORDERS: Tuple[int, ...] = (1, 2, 3, 5, 10, 15, 20)
+
+
+def _create_cases(orders: Tuple[int, ...]) -> Iterator[Dict[str, Any]]:
+    """
+    Function creates equations of benchmark.
+    :param orders: orders of equations with real negative roots.
+    :return: cases with name, coefficients, free argument, borders, limits and
+    required accuracy.
+    """
+
+    for accuracy in ACCURACIES:
+        yield {"case": "default", "coefficients": DEFAULT_COEFFICIENTS, "free_argument": 0,
+               "borders": DEFAULT_BORDERS, "limits": (0, 5), "accuracy": accuracy}
+    for order in orders:
+        coefficients = list(np.poly(-np.linspace(0.5, 1.5, order))[::-1])
+        yield {"case": f"order_{order}", "coefficients": coefficients, "free_argument": 1,
+               "borders": [1] + [0] * (order - 1), "limits": (0, 10), "accuracy": 1e-5}
+    yield {"case": "default_wide", "coefficients": DEFAULT_COEFFICIENTS, "free_argument": 0,
+           "borders": DEFAULT_BORDERS, "limits": (-100, 100), "accuracy": 1e-5}
+    yield {"case": "oscillator_wide", "coefficients": [1, 0, 1], "free_argument": 0, "borders": [0, 1],
+           "limits": (-100, 100), "accuracy": 1e-5}
+    yield {"case": "close_roots", "coefficients": list(np.poly([-2] * 6 + [-2.01])[::-1]), "free_argument": 0,
+           "borders": [1] + [0] * 6, "limits": (0, 5), "accuracy": 1e-5}
+    yield {"case": "stiff_2", "coefficients": [1000, 1001, 1], "free_argument": 0, "borders": [1, 0],
+           "limits": (0, 5), "accuracy": 1e-5}
+    yield {"case": "stiff_3", "coefficients": list(np.poly([-1, -100, -10000])[::-1]), "free_argument": 0,
+           "borders": [1, 0, 0], "limits": (0, 5), "accuracy": 1e-5}
+
+
+def _format_key(result: Dict[str, Any]) -> str:
+    """
+    Function formats key of result to print.
+    :param result: result of benchmark.
+    :return: text with key.
+    """
+
+    return " ".join(str(value) for value in _get_key(result) if value is not None)
+
+
+def _get_key(result: Dict[str, Any]) -> tuple:
+    """
+    Function returns key to find the same benchmark in results of other run.
+    :param result: result of benchmark.
+    :return: key.
+    """
+
+    return result["kind"], result["case"], result.get("method"), result.get("accuracy")
+
+
+def _measure(function: Callable[[], Any], repeats: int, memory: bool) -> Tuple[float, Optional[int], Any]:
+    """
+    Function measures wall time and peak memory of function. Wall time is the
+    best of repeats, fast function is repeated until MIN_MEASURE_TIME passes.
+    Memory is measured in separate call, because tracing of allocations slows
+    down Python code.
+    :param function: function to measure;
+    :param repeats: min number of calls to measure wall time;
+    :param memory: if True then peak memory is measured.
+    :return: wall time in seconds, peak memory in bytes and result of last
+    call.
+    """
+
+    wall_time = float("inf")
+    result = None
+    number_of_calls = 0
+    end_time = time.perf_counter() + MIN_MEASURE_TIME
+    while number_of_calls < repeats or time.perf_counter() < end_time:
+        start = time.perf_counter()
+        result = function()
+        wall_time = min(wall_time, time.perf_counter() - start)
+        number_of_calls += 1
+    peak_memory = None
+    if memory:
+        tracemalloc.start()
+        try:
+            function()
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return wall_time, peak_memory, result
+
+
+def compare(old_file_name: str, new_file_name: str, threshold: float) -> int:
+    """
+    Function compares results of two runs and prints changes of wall time and
+    peak memory.
+    :param old_file_name: file with results of old run;
+    :param new_file_name: file with results of new run;
+    :param threshold: relative increase of wall time or peak memory that is
+    considered regression.
+    :return: number of regressions.
+    """
+
+    with open(old_file_name, "r", encoding="utf-8") as file:
+        old_results = {_get_key(result): result for result in json.load(file)["results"]}
+    with open(new_file_name, "r", encoding="utf-8") as file:
+        new_results = json.load(file)["results"]
+    number_of_regressions = 0
+    for result in new_results:
+        old_result = old_results.get(_get_key(result))
+        if old_result is None:
+            print(f"{_format_key(result)}: new")
+            continue
+        changes = []
+        for name in ("wall_time", "peak_memory"):
+            if old_result.get(name) and result.get(name) is not None:
+                ratio = result[name] / old_result[name]
+                mark = ""
+                if ratio > 1 + threshold:
+                    mark = " REGRESSION"
+                    number_of_regressions += 1
+                elif ratio < 1 - threshold:
+                    mark = " improvement"
+                changes.append(f"{name} {old_result[name]:.4g} -> {result[name]:.4g} ({ratio - 1:+.1%}){mark}")
+        if old_result.get("reached") and not result.get("reached", True):
+            changes.append("required accuracy is not reached REGRESSION")
+            number_of_regressions += 1
+        print(f"{_format_key(result)}: {'; '.join(changes)}")
+    print(f"Regressions: {number_of_regressions}")
+    return number_of_regressions
+
+
+def run_exports(formats: List[str], repeats: int, memory: bool) -> Iterator[Dict[str, Any]]:
+    """
+    Function measures export of solution to files.
+    :param formats: formats of files;
+    :param repeats: number of runs to measure wall time;
+    :param memory: if True then peak memory is measured.
+    :return: results of benchmarks.
+    """
+
+    xs = np.linspace(0, 100, EXPORT_NUMBER_OF_POINTS)
+    ys = np.column_stack([np.sin(xs + phase) for phase in range(5)])
+    with tempfile.TemporaryDirectory() as dir_name:
+        for file_format in formats:
+            file_name = os.path.join(dir_name, f"solution.{file_format}")
+            wall_time, peak_memory, _ = _measure(lambda: save_solution(file_name, xs, ys), repeats, memory)
+            yield {"kind": "export", "case": file_format, "number_of_points": len(xs), "wall_time": wall_time,
+                   "points_per_second": len(xs) / wall_time, "peak_memory": peak_memory,
+                   "file_size": os.path.getsize(file_name)}
+
+
+def run_solution(case: Dict[str, Any], method: SolutionMethod, repeats: int, memory: bool,
+                 number_of_workers: int) -> Dict[str, Any]:
+    """
+    Function measures solution of equation by given method. Every call solves
+    equation with new solver, so that cache and superpositions of previous
+    calls are not used.
+    :param case: equation;
+    :param method: method of solution;
+    :param repeats: number of runs to measure wall time;
+    :param memory: if True then peak memory is measured;
+    :param number_of_workers: number of worker processes.
+    :return: result of benchmark.
+    """
+
+    def solve() -> Tuple[Optional[float], SolverCore]:
+        core = SolverCore()
+        core.number_of_workers = number_of_workers
+        try:
+            return core.start_calculation(method, case["accuracy"], case["coefficients"], case["free_argument"],
+                                          case["borders"], case["limits"]), core
+        finally:
+            core.shutdown_workers()
+
+    wall_time, peak_memory, (accuracy, core) = _measure(solve, repeats, memory)
+    metrics = core.metrics
+    steps = metrics.steps
+    exact_ys = ExactSolution(case["coefficients"], case["free_argument"], case["borders"],
+                             case["limits"][0]).calculate(core.xs)
+    exact_error = float(np.abs(np.asarray(core.ys)[:, 0] - exact_ys[:, 0]).max() / max(1, np.abs(exact_ys[:, 0]).max()))
+    return {"kind": "solution", "case": case["case"], "method": method.name, "accuracy": case["accuracy"],
+            "order": len(case["coefficients"]) - 1, "limits": list(case["limits"]), "reached": accuracy is not None,
+            "solution_accuracy": accuracy, "wall_time": wall_time, "iterations": len(metrics.iteration_times),
+            "steps": steps, "steps_per_second": steps / wall_time, "evaluations": metrics.evaluations,
+            "emission_time": metrics.emission_time, "trajectory_memory": metrics.trajectory_memory,
+            "peak_memory": peak_memory, "exact_error": exact_error}
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Function parses arguments of command line.
+    :return: arguments.
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark of solution methods and exports")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+    run_parser = subparsers.add_parser("run", help="run benchmarks")
+    run_parser.add_argument("-o", "--output", default="benchmark.json", help="JSON file for results")
+    run_parser.add_argument("-m", "--methods", nargs="+", choices=METHODS, default=METHODS,
+                            help="methods of solution")
+    run_parser.add_argument("-k", "--filter", default="", help="run only cases with given text in name")
+    run_parser.add_argument("-r", "--repeats", type=int, default=1, help="min number of runs to measure wall time")
+    run_parser.add_argument("-w", "--workers", type=int, default=1, help="number of worker processes")
+    run_parser.add_argument("--orders", nargs="+", type=int, default=list(ORDERS),
+                            help="orders of equations from 1 to 20")
+    run_parser.add_argument("--no-memory", action="store_true", help="do not measure peak memory")
+    run_parser.add_argument("--no-export", action="store_true", help="do not measure exports")
+    compare_parser = subparsers.add_parser("compare", help="compare results of two runs")
+    compare_parser.add_argument("old", help="JSON file with results of old run")
+    compare_parser.add_argument("new", help="JSON file with results of new run")
+    compare_parser.add_argument("-t", "--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="relative increase of wall time or peak memory considered regression")
+    return parser.parse_args()
+
+
+def run(arguments: argparse.Namespace) -> int:
+    """
+    Function runs benchmarks and saves results to JSON file. Overflow in
+    explicit methods on stiff equations is expected, so numerical warnings are
+    not shown. Exact solution is checked against solution by Runge-Kutta
+    method: if required accuracy is reached, error of Runge-Kutta solution
+    greater than ORACLE_TOLERANCE times required accuracy means that exact
+    solution is wrong.
+    :param arguments: arguments of command line.
+    :return: number of cases in which exact solution is wrong.
+    """
+
+    memory = not arguments.no_memory
+    results = []
+    number_of_mismatches = 0
+    warnings.simplefilter("ignore", RuntimeWarning)
+    for case in _create_cases(tuple(arguments.orders)):
+        if arguments.filter not in case["case"]:
+            continue
+        for method_name in arguments.methods:
+            result = run_solution(case, SolutionMethod[method_name], arguments.repeats, memory, arguments.workers)
+            results.append(result)
+            print(f"{_format_key(result)}: {result['wall_time']:.3f} s, {result['steps_per_second']:.0f} steps/s, "
+                  f"accuracy {result['solution_accuracy']}, error {result['exact_error']:.3g}")
+            if (method_name == SolutionMethod.RUNGE_KUTTA.name and result["reached"] and
+                    not result["exact_error"] <= ORACLE_TOLERANCE * case["accuracy"]):
+                print(f"{_format_key(result)}: exact solution differs from Runge-Kutta solution MISMATCH")
+                number_of_mismatches += 1
+    formats = [] if arguments.no_export else [file_format for file_format in EXPORT_FORMATS
+                                              if arguments.filter in f"export_{file_format}"]
+    for result in run_exports(formats, arguments.repeats, memory):
+        results.append(result)
+        print(f"{_format_key(result)}: {result['wall_time']:.3f} s, {result['points_per_second']:.0f} points/s")
+    metadata = {"date": datetime.now().isoformat(timespec="seconds"), "python": platform.python_version(),
+                "numpy": np.__version__, "platform": platform.platform(), "cpu_count": os.cpu_count(),
+                "workers": arguments.workers, "repeats": arguments.repeats}
+    with open(arguments.output, "w", encoding="utf-8") as file:
+        json.dump({"metadata": metadata, "results": results}, file, indent=2)
+    return number_of_mismatches
+
+
+def main() -> int:
+    arguments = parse_arguments()
+    if arguments.command == "compare":
+        return 1 if compare(arguments.old, arguments.new, arguments.threshold) else 0
+    return 1 if run(arguments) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+File to solve differential equations from command line without GUI.
+
+Usage:
+    python cli.py equations.json [-o output directory] [-f npz|npy|csv|txt|xlsx] [-s spacing]
+        [-w number of workers] [-p]
+
+File with equations contains list of objects (or one object) with fields:
+    name: name of output file (optional, index of equation by default);
+    method: name of solution method from SolutionMethod that has solver in
+        SolverCore (optional);
+    accuracy: required accuracy of solution;
+    coefficients: coefficients in equation, from y to highest derivative;
+    free_argument: free argument in equation;
+    borders: values of y and its derivatives at left end of segment;
+    limits: segment in which to find solution.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+from typing import Any, Dict, List
+import numpy as np
+from solution import SolutionMethod, SolverCore
+from solution.export import save_solution
+
+DEFAULT_SOLUTION_METHOD: SolutionMethod = SolutionMethod.VECTORIZED_RUNGE_KUTTA
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Function parses arguments of command line.
+    :return: arguments.
+    """
+
+    parser = argparse.ArgumentParser(description="Solve linear differential equations with constant coefficients")
+    parser.add_argument("equations", help="JSON file with equations")
+    parser.add_argument("-o", "--output", default=".", help="directory for results")
+    parser.add_argument("-f", "--format", choices=("npz", "npy", "csv", "txt", "xlsx"), default="npz",
+                        help="format of results")
+    parser.add_argument("-s", "--spacing", type=float, default=None,
+                        help="spacing of output grid, by default solution is saved in points of integration")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("-p", "--profile", action="store_true",
+                        help="save statistics of cProfile and tracemalloc to directory for results")
+    return parser.parse_args()
+
+
+def read_equations(file_name: str) -> List[Dict[str, Any]]:
+    """
+    Function reads equations from JSON file.
+    :param file_name: name of file.
+    :return: list with equations.
+    """
+
+    with open(file_name, "r", encoding="utf-8") as file:
+        equations = json.load(file)
+    if isinstance(equations, dict):
+        equations = [equations]
+    return equations
+
+
+def main() -> int:
+    """
+    Function solves equations from file given in command line.
+    :return: exit code.
+    """
+
+    arguments = parse_arguments()
+    os.makedirs(arguments.output, exist_ok=True)
+    solver = SolverCore()
+    solver.number_of_workers = arguments.workers
+    if arguments.profile:
+        solver.profile_dir_name = arguments.output
+    exit_code = 0
+    try:
+        for index, equation in enumerate(read_equations(arguments.equations)):
+            name = str(equation.get("name", index))
+            method_name = equation.get("method", DEFAULT_SOLUTION_METHOD.name)
+            solution_method = SolutionMethod.__members__.get(method_name)
+            if solution_method not in solver.solvers:
+                method_names = ", ".join(method.name for method in solver.solvers)
+                print(f"{name}: unsupported solution method {method_name}, supported methods: {method_names}",
+                      file=sys.stderr)
+                exit_code = 1
+                continue
+            accuracy = solver.start_calculation(solution_method, float(equation["accuracy"]),
+                                                [float(value) for value in equation["coefficients"]],
+                                                float(equation.get("free_argument", 0)),
+                                                [float(value) for value in equation["borders"]],
+                                                tuple(equation["limits"]))
+            print(f"{name}: {solver.metrics}")
+            if accuracy is None:
+                print(f"{name}: required accuracy was not reached", file=sys.stderr)
+                exit_code = 1
+                continue
+            xs, ys = solver.xs, solver.ys
+            if arguments.spacing:
+                min_x, max_x = equation["limits"]
+                xs = min_x + arguments.spacing * np.arange(int((max_x - min_x) / arguments.spacing + 1e-9) + 1)
+                ys = solver.sample(xs)
+            save_solution(os.path.join(arguments.output, f"{name}.{arguments.format}"), xs, ys)
+            print(f"{name}: accuracy {accuracy:.3g}, {len(xs)} points")
+    finally:
+        solver.shutdown_workers()
+    return exit_code
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
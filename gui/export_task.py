@@ -0,0 +1,88 @@
+"""
+File with class to export results in thread pool, so that main window is not
+blocked while large files are written.
+"""
+
+import os
+from typing import Any, Callable
+from PyQt5.QtCore import pyqtSignal, QObject, QRunnable
+from solution.progress import CalculationStopped, Progress
+
+
+class ExportSignals(QObject):
+    """
+    Class with signals of export task. Every signal is sent with name of file
+    to which results are exported.
+    """
+
+    export_failed: pyqtSignal = pyqtSignal(str, str)
+    export_finished: pyqtSignal = pyqtSignal(str)
+    export_stopped: pyqtSignal = pyqtSignal(str)
+    progress_changed: pyqtSignal = pyqtSignal(str, float, float, float)
+
+
+class ExportTask(QRunnable):
+    """
+    Class for task that exports results to file in thread of thread pool.
+    Function of export is called with name of file, given arguments and
+    keyword argument progress with Progress object, through which progress of
+    export is reported and export is stopped.
+    """
+
+    def __init__(self, file_name: str, function: Callable[..., None], *args: Any):
+        """
+        :param file_name: name of file;
+        :param function: function to export results;
+        :param args: arguments of function after name of file.
+        """
+
+        super().__init__()
+        self.setAutoDelete(False)
+        self._args: tuple = args
+        self._function: Callable[..., None] = function
+        self._progress: Progress = Progress(self._report_progress)
+        self.file_name: str = file_name
+        self.signals: ExportSignals = ExportSignals()
+
+    def _remove_file(self):
+        """
+        Method removes incomplete file after export was stopped or failed.
+        """
+
+        try:
+            os.remove(self.file_name)
+        except OSError:
+            pass
+
+    def _report_progress(self, fraction: float, speed: float, time_left: float):
+        """
+        Method sends signal with progress of export.
+        :param fraction: fraction of exported rows;
+        :param speed: number of rows exported per second;
+        :param time_left: estimated time to finish export in seconds.
+        """
+
+        self.signals.progress_changed.emit(self.file_name, fraction, speed, time_left)
+
+    def run(self):
+        """
+        Method exports results. It is called in thread of thread pool.
+        """
+
+        try:
+            self._function(self.file_name, *self._args, progress=self._progress)
+        except CalculationStopped:
+            self._remove_file()
+            self.signals.export_stopped.emit(self.file_name)
+        except Exception as exc:
+            self._remove_file()
+            self.signals.export_failed.emit(self.file_name, str(exc))
+        else:
+            self.signals.export_finished.emit(self.file_name)
+
+    def stop(self):
+        """
+        Method stops export. It can be called from any thread.
+        """
+
+        self._progress.stop()
@@ -3,16 +3,25 @@ File with class for main window of application.
 """
 
 import os
-from typing import List
+from typing import Any, Callable, Dict, List
 import matplotlib.pyplot as plt
+import numpy as np
 import PyQt5.QtWidgets as qt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from PyQt5.QtCore import pyqtSignal, pyqtSlot, QRegExp, Qt, QThread
+from matplotlib.axes import Axes
+from matplotlib.backend_bases import DrawEvent
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas, NavigationToolbar2QT
+from matplotlib.lines import Line2D
+from PyQt5.QtCore import pyqtSignal, pyqtSlot, QRegExp, Qt, QThread, QThreadPool
 from PyQt5.QtGui import QCloseEvent, QIcon, QRegExpValidator
 import gui.utils as ut
+from gui.export_task import ExportTask
 from gui.label import Label
 from gui.text_edit import TextEdit
-from solution import SolutionMethod, Solver
+from solution import SolutionMethod
+from solution.export import save_solution
+from solution.metrics import CalculationMetrics
+from solution.pyramid import MinMaxPyramid
+from solution.solver import Solver
 
 
 class MainWindow(qt.QMainWindow):
@@ -28,35 +37,60 @@ class MainWindow(qt.QMainWindow):
     DEFAULT_FREE_ARGUMENT: float = 0
     DEFAULT_MAX_X: int = 5
     DEFAULT_MIN_X: int = 0
+    DEFAULT_SOLUTION_METHOD: SolutionMethod = SolutionMethod.VECTORIZED_RUNGE_KUTTA
     MAX_LINE_EDIT_WIDTH: int = 50
+    MAX_NUMBER_OF_EXPORTS: int = 4
+    MAX_NUMBER_OF_POINTS: int = 1000
     MAX_TEXT_EDIT_HEIGHT: int = 100
     MAX_X: int = 100
     MIN_COMBO_BOX_WIDTH: int = 100
     MIN_SCROLL_AREA_HEIGHT: int = 150
     MIN_SPIN_BOX_WIDTH: int = 50
     MIN_X: int = -100
+    SOLUTION_METHODS: Dict[SolutionMethod, str] = {
+        SolutionMethod.RUNGE_KUTTA: "Рунге-Кутта",
+        SolutionMethod.VECTORIZED_RUNGE_KUTTA: "Рунге-Кутта (векторизованный)",
+        SolutionMethod.LINEAR_PROPAGATOR: "Рунге-Кутта (пропагатор шага)",
+        SolutionMethod.LOCKSTEP_RUNGE_KUTTA: "Рунге-Кутта (шаги h и 2h совместно)",
+        SolutionMethod.PARAREAL: "Рунге-Кутта (Parareal, параллельно по x)",
+        SolutionMethod.DORMAND_PRINCE: "Дорман-Принс (адаптивный шаг)",
+        SolutionMethod.ROSENBROCK: "Розенброк (жесткие уравнения)",
+        SolutionMethod.BACKWARD_DIFFERENTIATION: "ФДН (жесткие уравнения)",
+        SolutionMethod.EXACT: "Точное решение"}
     calculation_started: pyqtSignal = pyqtSignal(SolutionMethod, float, list, float, list, tuple)
     calculation_stopped: pyqtSignal = pyqtSignal()
 
     def __init__(self):
         super().__init__()
+        self._animated: bool = False
+        self._axes: Axes = None
+        self._background = None
         self._borders: List[float] = self.DEFAULT_BORDERS
         self._coefficients: List[float] = self.DEFAULT_COEFFICIENTS
         self._dir_name: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "images")
         self._dir_name_for_save: str = ut.get_dir_name()
         self._equation_order: int = self.DEFAULT_EQUATION_ORDER
+        self._export_pool: QThreadPool = QThreadPool(self)
+        self._export_pool.setMaxThreadCount(self.MAX_NUMBER_OF_EXPORTS)
+        self._export_progress_bars: Dict[str, qt.QWidget] = {}
+        self._exports: Dict[str, ExportTask] = {}
         self._free_argument: float = self.DEFAULT_FREE_ARGUMENT
+        self._lines: List[Line2D] = []
         self._max_x: int = self.DEFAULT_MAX_X
         self._min_x: int = self.DEFAULT_MIN_X
+        self._pyramid: MinMaxPyramid = None
         self._solver: Solver = None
         self._solver_thread: QThread = None
-        self._xs: List[float] = []
-        self._ys: List[List[float]] = []
+        self._xs: np.ndarray = np.empty(0)
+        self._ys: np.ndarray = np.empty((0, 0))
         self.button_save_figure: qt.QPushButton = None
         self.button_save_result: qt.QPushButton = None
         self.button_set_equation_order: qt.QPushButton = None
         self.button_solve: qt.QPushButton = None
+        self.button_stop: qt.QPushButton = None
+        self.check_box_profile: qt.QCheckBox = None
         self.combo_box_graph: qt.QComboBox = None
+        self.combo_box_method: qt.QComboBox = None
         self.figure = plt.figure()
         self.figure_canvas: FigureCanvas = None
         self.labels_borders: List[Label] = []
@@ -67,18 +101,31 @@ class MainWindow(qt.QMainWindow):
         self.line_edit_free_argument: qt.QLineEdit = None
         self.line_edits_borders: List[qt.QLineEdit] = []
         self.line_edits_coefficients: List[qt.QLineEdit] = []
+        self.navigation_toolbar: NavigationToolbar2QT = None
         self.progress_bar: qt.QProgressBar = None
         self.scroll_area: qt.QScrollArea = None
         self.spin_box_equation_order: qt.QSpinBox = None
+        self.spin_box_workers: qt.QSpinBox = None
         self.spin_box_x_max: qt.QSpinBox = None
         self.spin_box_x_min: qt.QSpinBox = None
         self.text_edit: TextEdit = None
         self._init_ui()
         self._start_thread()
 
+    def _animate_lines(self, animated: bool):
+        """
+        Method makes lines of graphs animated, so that they are drawn by
+        blitting over background of axes.
+        :param animated: if True then lines will be animated.
+        """
+
+        self._animated = animated
+        for line in self._lines:
+            line.set_animated(animated)
+
     def _clear_graph(self):
-        self._xs.clear()
-        self._ys.clear()
+        self._pyramid = None
+        self._set_graph_data(np.empty(0), np.empty((0, 0)))
         self.show_graph(self.combo_box_graph.currentIndex())
 
     def _enable_widgets(self, enable: bool):
@@ -88,9 +135,23 @@ class MainWindow(qt.QMainWindow):
         """
 
         widgets = (self.button_save_figure, self.button_save_result, self.button_set_equation_order, self.button_solve,
-                   self.line_edit_accuracy, self.spin_box_equation_order, self.scroll_area)
+                   self.check_box_profile, self.combo_box_method, self.line_edit_accuracy, self.spin_box_equation_order,
+                   self.spin_box_workers, self.scroll_area)
         for widget in widgets:
             widget.setEnabled(enable)
+        self.button_stop.setEnabled(not enable)
+
+    def _finish_export(self, file_name: str):
+        """
+        Method removes task and progress bar of finished export.
+        :param file_name: name of file to which results were exported.
+        """
+
+        self._exports.pop(file_name, None)
+        widget = self._export_progress_bars.pop(file_name, None)
+        if widget is not None:
+            self.statusBar().removeWidget(widget)
+            widget.deleteLater()
 
     def _init_scroll_area(self) -> qt.QScrollArea:
         """
@@ -229,10 +290,35 @@ class MainWindow(qt.QMainWindow):
         self.line_edit_accuracy.setValidator(QRegExpValidator(QRegExp(r"\d+\.?(\d+)?")))
         form_layout_accuracy = qt.QFormLayout()
         form_layout_accuracy.addRow(qt.QLabel(line_edit_accuracy_name), self.line_edit_accuracy)
+        self.combo_box_method = qt.QComboBox()
+        combo_box_method_name = "Метод решения"
+        self.combo_box_method.setToolTip(combo_box_method_name)
+        self.combo_box_method.setMinimumWidth(self.MIN_COMBO_BOX_WIDTH)
+        for solution_method, method_name in self.SOLUTION_METHODS.items():
+            self.combo_box_method.addItem(method_name, solution_method)
+        form_layout_method = qt.QFormLayout()
+        form_layout_method.addRow(qt.QLabel(combo_box_method_name), self.combo_box_method)
+        self.spin_box_workers = qt.QSpinBox()
+        spin_box_workers_name = "Число процессов"
+        self.spin_box_workers.setToolTip("Число процессов для одновременного расчета с разными шагами или для "
+                                         "метода Parareal")
+        self.spin_box_workers.setMinimumWidth(self.MIN_SPIN_BOX_WIDTH)
+        self.spin_box_workers.setMinimum(1)
+        self.spin_box_workers.setMaximum(os.cpu_count() or 1)
+        form_layout_workers = qt.QFormLayout()
+        form_layout_workers.addRow(qt.QLabel(spin_box_workers_name), self.spin_box_workers)
+        self.check_box_profile = qt.QCheckBox("Профилирование")
+        self.check_box_profile.setToolTip("Сохранить статистику cProfile и tracemalloc в папку для сохранения "
+                                          "результатов")
         button_solve_name = "Решить уравнение"
         self.button_solve = qt.QPushButton(button_solve_name)
         self.button_solve.setToolTip(button_solve_name)
         self.button_solve.clicked.connect(self.start_calculation)
+        button_stop_name = "Остановить расчет"
+        self.button_stop = qt.QPushButton(button_stop_name)
+        self.button_stop.setToolTip(button_stop_name)
+        self.button_stop.setEnabled(False)
+        self.button_stop.clicked.connect(self.stop_calculation)
         button_save_figure_name = "Сохранить график"
         self.button_save_figure = qt.QPushButton(button_save_figure_name)
         self.button_save_figure.setToolTip(button_save_figure_name)
@@ -243,7 +329,11 @@ class MainWindow(qt.QMainWindow):
         self.button_save_result.clicked.connect(self.save_result)
         h_layout_2 = qt.QHBoxLayout()
         h_layout_2.addLayout(form_layout_accuracy)
+        h_layout_2.addLayout(form_layout_method)
+        h_layout_2.addLayout(form_layout_workers)
+        h_layout_2.addWidget(self.check_box_profile)
         h_layout_2.addWidget(self.button_solve)
+        h_layout_2.addWidget(self.button_stop)
         h_layout_2.addWidget(self.button_save_figure)
         h_layout_2.addWidget(self.button_save_result)
         h_layout_2.addStretch(1)
@@ -265,6 +355,11 @@ class MainWindow(qt.QMainWindow):
         h_layout.addWidget(self.combo_box_graph)
         h_layout.addStretch(1)
         self.figure_canvas = FigureCanvas(self.figure)
+        self.figure_canvas.mpl_connect("draw_event", self._update_background)
+        self._axes = self.figure.add_subplot(111)
+        self._axes.set_xlabel("X")
+        self._axes.callbacks.connect("xlim_changed", self._show_window)
+        self.navigation_toolbar = NavigationToolbar2QT(self.figure_canvas, self)
         self.progress_bar = qt.QProgressBar()
         self.progress_bar.setMinimum(0)
         self.progress_bar.setMaximum(100)
@@ -276,6 +371,7 @@ class MainWindow(qt.QMainWindow):
         v_layout = qt.QVBoxLayout()
         v_layout.addWidget(group_box_params)
         v_layout.addLayout(h_layout)
+        v_layout.addWidget(self.navigation_toolbar)
         v_layout.addWidget(self.figure_canvas, 1)
         v_layout.addWidget(self.progress_bar)
         v_layout.addWidget(self.text_edit)
@@ -300,6 +396,7 @@ class MainWindow(qt.QMainWindow):
             self.line_edits_borders[index].setText(str(border))
         self._update_scroll_area(self._equation_order)
         self.line_edit_accuracy.setText(f"{self.DEFAULT_ACCURACY:.5f}")
+        self.combo_box_method.setCurrentIndex(self.combo_box_method.findData(self.DEFAULT_SOLUTION_METHOD))
         self._set_graphs_to_combo_box(self.DEFAULT_EQUATION_ORDER)
 
     def _set_graphs_to_combo_box(self, equation_order: int):
@@ -317,6 +414,74 @@ class MainWindow(qt.QMainWindow):
         self.combo_box_graph.clear()
         self.combo_box_graph.addItems(graphs)
 
+    def _set_graph_data(self, xs: np.ndarray, ys: np.ndarray):
+        """
+        Method sets solution to lines of graphs. Columns of solution are kept by
+        lines, so switching between graphs does not extract them again.
+        :param xs: x coordinates;
+        :param ys: array with values of y and its derivatives in rows.
+        """
+
+        self._xs, self._ys = xs, ys
+        number_of_graphs = ys.shape[1] if len(xs) else 0
+        while len(self._lines) < number_of_graphs:
+            line, = self._axes.plot([], [], color="blue", visible=False, animated=self._animated)
+            self._lines.append(line)
+        for index, line in enumerate(self._lines):
+            if index < number_of_graphs:
+                line.set_data(xs, ys[:, index])
+            else:
+                line.set_data([], [])
+
+    def _show_window(self, axes: Axes):
+        """
+        Method shows part of solution in new limits of x axis. Points are taken
+        from level of pyramid that matches width of limits.
+        :param axes: axes with new limits.
+        """
+
+        if self._animated or self._pyramid is None:
+            return
+        xs, ys = self._pyramid.get_window(*axes.get_xlim(), self.MAX_NUMBER_OF_POINTS)
+        self._set_graph_data(xs, ys)
+
+    def _start_export(self, file_name: str, function: Callable[..., None], *args: Any):
+        """
+        Method starts export of results to file in thread pool. Progress of
+        export is shown in status bar with button to stop export.
+        :param file_name: name of file;
+        :param function: function to export results;
+        :param args: arguments of function after name of file.
+        """
+
+        if file_name in self._exports:
+            qt.QMessageBox.information(self, "Информация", f"Файл {file_name} уже сохраняется")
+            return
+        task = ExportTask(file_name, function, *args)
+        task.signals.export_failed.connect(self.handle_failure_of_export)
+        task.signals.export_finished.connect(self.handle_finish_of_export)
+        task.signals.export_stopped.connect(self.handle_stop_of_export)
+        task.signals.progress_changed.connect(self.handle_change_of_export_progress)
+        progress_bar = qt.QProgressBar()
+        progress_bar.setMinimum(0)
+        progress_bar.setMaximum(100)
+        progress_bar.setFormat(f"{os.path.basename(file_name)}: %p%")
+        progress_bar.setToolTip(file_name)
+        button_stop = qt.QPushButton("Отменить")
+        button_stop.setToolTip("Отменить сохранение")
+        button_stop.clicked.connect(task.stop)
+        h_layout = qt.QHBoxLayout()
+        h_layout.setContentsMargins(0, 0, 0, 0)
+        h_layout.addWidget(progress_bar)
+        h_layout.addWidget(button_stop)
+        widget = qt.QWidget()
+        widget.setLayout(h_layout)
+        self.statusBar().addPermanentWidget(widget)
+        self._export_progress_bars[file_name] = widget
+        self._exports[file_name] = task
+        self.text_edit.append(f"Export to {file_name} started")
+        self._export_pool.start(task)
+
     def _start_thread(self):
         """
         Method starts thread for calculation.
@@ -325,14 +490,21 @@ class MainWindow(qt.QMainWindow):
         self._solver_thread = QThread(self)
         self._solver_thread.setTerminationEnabled(True)
         self._solver = Solver()
+        self._solver.cache.set_dir_name(os.path.join(ut.get_dir_name(), "cache"))
         self._solver.moveToThread(self._solver_thread)
+        self._solver.cache_checked.connect(self.handle_check_of_cache)
         self._solver.calculation_finished.connect(self.handle_finish_of_calculation)
         self._solver.calculation_for_step_finished.connect(self.handle_finish_of_calculation_for_step)
         self._solver.calculation_for_step_started.connect(self.handle_start_of_calculation_for_step)
         self._solver.calculation_started.connect(self.handle_start_of_calculation)
+        self._solver.chunk_calculated.connect(self.handle_calculation_of_chunk)
         self._solver.max_iterations_used.connect(self.handle_using_of_max_iterations)
-        self._solver.segment_done.connect(self.handle_step_done)
+        self._solver.metrics_collected.connect(self.handle_collection_of_metrics)
+        self._solver.progress_changed.connect(self.handle_change_of_progress)
+        self._solver.pyramid_built.connect(self.handle_build_of_pyramid)
+        self._solver.steps_counted.connect(self.handle_steps_counted)
         self.calculation_started.connect(self._solver.start_calculation)
+        self.calculation_stopped.connect(self._solver.stop_calculation, Qt.DirectConnection)
         self._solver_thread.start()
 
     def _update_scroll_area(self, equation_order: int):
@@ -353,6 +525,20 @@ class MainWindow(qt.QMainWindow):
             if index < self.MAX_EQUATION_ORDER - 1:
                 self.labels_commas[index].setVisible(index < equation_order - 1)
 
+    def _update_background(self, event: DrawEvent):
+        """
+        Method saves background of axes after figure was drawn and draws
+        animated lines over it.
+        :param event: draw event.
+        """
+
+        if event.canvas is not self.figure_canvas:
+            return
+        self._background = self.figure_canvas.copy_from_bbox(self._axes.bbox)
+        for line in self._lines:
+            if line.get_animated() and line.get_visible():
+                self._axes.draw_artist(line)
+
     @pyqtSlot(int)
     def check_limits(self, new_limit: int):
         """
@@ -371,9 +557,108 @@ class MainWindow(qt.QMainWindow):
         :param event: close event.
         """
 
+        for task in self._exports.values():
+            task.stop()
+        self._export_pool.waitForDone()
         self._solver_thread.quit()
+        self._solver.shutdown_workers()
         super().closeEvent(event)
 
+    @pyqtSlot(object)
+    def handle_build_of_pyramid(self, pyramid: MinMaxPyramid):
+        """
+        Slot handles signal with pyramid of min and max values of solution.
+        :param pyramid: pyramid of solution.
+        """
+
+        self._pyramid = pyramid
+
+    @pyqtSlot(object, object)
+    def handle_calculation_of_chunk(self, xs: np.ndarray, ys: np.ndarray):
+        """
+        Slot handles signal with chunk of solution calculated during integration
+        and adds it to graph.
+        :param xs: x coordinates of chunk;
+        :param ys: solution in chunk.
+        """
+
+        if not len(xs):
+            return
+        self._set_graph_data(np.concatenate((self._xs, xs)), np.concatenate((self._ys.reshape(-1, ys.shape[1]), ys)))
+        graph_index = self.combo_box_graph.currentIndex()
+        if graph_index >= ys.shape[1]:
+            return
+        y_min, y_max = self._axes.get_ylim()
+        if self._background is None or len(xs) == len(self._xs) or not np.all(np.isfinite(ys[:, graph_index])) or\
+                ys[:, graph_index].min() < y_min or ys[:, graph_index].max() > y_max:
+            self._axes.relim(visible_only=True)
+            self._axes.autoscale_view(scalex=False)
+            self.figure_canvas.draw_idle()
+            return
+        self.figure_canvas.restore_region(self._background)
+        self._axes.draw_artist(self._lines[graph_index])
+        self.figure_canvas.blit(self._axes.bbox)
+
+    @pyqtSlot(str, float, float, float)
+    def handle_change_of_export_progress(self, file_name: str, fraction: float, speed: float, time_left: float):
+        """
+        Slot handles signal with progress of export.
+        :param file_name: name of file to which results are exported;
+        :param fraction: fraction of exported rows;
+        :param speed: number of rows exported per second;
+        :param time_left: estimated time to finish export in seconds.
+        """
+
+        widget = self._export_progress_bars.get(file_name)
+        if widget is not None:
+            progress_bar = widget.findChild(qt.QProgressBar)
+            progress_bar.setValue(round(100 * fraction))
+            progress_bar.setFormat(f"{os.path.basename(file_name)}: %p% ({time_left:.1f} s left)")
+
+    @pyqtSlot(float, float, float)
+    def handle_change_of_progress(self, fraction: float, speed: float, time_left: float):
+        """
+        Slot handles signal with progress of integration.
+        :param fraction: fraction of integrated segment;
+        :param speed: number of steps per second;
+        :param time_left: estimated time to finish integration in seconds.
+        """
+
+        self.progress_bar.setValue(round(100 * fraction))
+        self.progress_bar.setFormat(f"%p% ({speed:.0f} steps/s, {time_left:.1f} s left)")
+
+    @pyqtSlot(bool)
+    def handle_check_of_cache(self, hit: bool):
+        """
+        Slot handles signal that solution was searched in cache.
+        :param hit: if True then solution was found in cache.
+        """
+
+        self.text_edit.append("Cache hit" if hit else "Cache miss")
+
+    @pyqtSlot(object)
+    def handle_collection_of_metrics(self, metrics: CalculationMetrics):
+        """
+        Slot handles signal with metrics of calculation.
+        :param metrics: metrics of calculation.
+        """
+
+        self.text_edit.append(f"Metrics: {metrics}")
+        for file_name in metrics.profile_file_names:
+            self.text_edit.append(f"Profile saved to {file_name}")
+
+    @pyqtSlot(str, str)
+    def handle_failure_of_export(self, file_name: str, message: str):
+        """
+        Slot handles signal that export failed.
+        :param file_name: name of file to which results were exported;
+        :param message: error message.
+        """
+
+        self._finish_export(file_name)
+        self.text_edit.append(f"Export to {file_name} failed: {message}")
+        qt.QMessageBox.warning(self, "Ошибка", f"Не удалось сохранить файл {file_name}:\n{message}")
+
     @pyqtSlot()
     def handle_finish_of_calculation(self):
         """
@@ -381,22 +666,34 @@ class MainWindow(qt.QMainWindow):
         """
 
         self.progress_bar.setVisible(False)
+        self._animate_lines(False)
         self.show_graph(self.combo_box_graph.currentIndex())
         self.text_edit.append("Calculation finished\n")
         self._enable_widgets(True)
 
-    @pyqtSlot(list, list, float)
-    def handle_finish_of_calculation_for_step(self, xs: List[float], ys: List[float], accuracy: float):
+    @pyqtSlot(object, object, float)
+    def handle_finish_of_calculation_for_step(self, xs: np.ndarray, ys: np.ndarray, accuracy: float):
         """
         Slot handles signal that calculation for given step was finished.
-        :param xs: list with x coordinates;
-        :param ys: list with y coordinates;
+        :param xs: decimated x coordinates;
+        :param ys: decimated values of y and its derivatives;
         :param accuracy: accuracy of calculation.
         """
 
-        self._xs, self._ys = xs, ys
+        self._set_graph_data(xs, ys)
+        self.show_graph(self.combo_box_graph.currentIndex())
         self.text_edit.append(f"Calculation accuracy: {accuracy}")
 
+    @pyqtSlot(str)
+    def handle_finish_of_export(self, file_name: str):
+        """
+        Slot handles signal that export was finished.
+        :param file_name: name of file to which results were exported.
+        """
+
+        self._finish_export(file_name)
+        self.text_edit.append(f"Export to {file_name} finished")
+
     @pyqtSlot(list, list)
     def handle_start_of_calculation(self, coefficients: List[float], borders: List[float]):
         """
@@ -406,6 +703,7 @@ class MainWindow(qt.QMainWindow):
         """
 
         self.text_edit.append("Calculation started")
+        self._animate_lines(True)
 
     @pyqtSlot(int, float)
     def handle_start_of_calculation_for_step(self, iteration_number: int, step: float):
@@ -416,16 +714,33 @@ class MainWindow(qt.QMainWindow):
         """
 
         self.text_edit.append(f"Iteration number: {iteration_number}, step size: {step}")
+        self._pyramid = None
+        self._set_graph_data(np.empty(0), np.empty((0, 0)))
+        self._axes.set_xlim(self.spin_box_x_min.value(), self.spin_box_x_max.value(), auto=True)
+        self.figure_canvas.draw_idle()
         self.progress_bar.setValue(0)
+        self.progress_bar.setFormat("%p%")
         self.progress_bar.setVisible(True)
 
-    @pyqtSlot()
-    def handle_step_done(self):
+    @pyqtSlot(int, int)
+    def handle_steps_counted(self, accepted_steps: int, rejected_steps: int):
+        """
+        Slot handles signal with number of steps of adaptive method.
+        :param accepted_steps: number of accepted steps;
+        :param rejected_steps: number of rejected steps.
+        """
+
+        self.text_edit.append(f"Accepted steps: {accepted_steps}, rejected steps: {rejected_steps}")
+
+    @pyqtSlot(str)
+    def handle_stop_of_export(self, file_name: str):
         """
-        Slot handles signal that
+        Slot handles signal that export was stopped.
+        :param file_name: name of file to which results were exported.
         """
 
-        self.progress_bar.setValue(self.progress_bar.value() + 1)
+        self._finish_export(file_name)
+        self.text_edit.append(f"Export to {file_name} stopped")
 
     @pyqtSlot(int)
     def handle_using_of_max_iterations(self, iteration_number: int):
@@ -441,10 +756,11 @@ class MainWindow(qt.QMainWindow):
     @pyqtSlot()
     def save_figure(self):
         """
-        Slot saves figure.
+        Slot saves figure. Figure is rendered in main thread and image is
+        written to file in thread pool.
         """
 
-        if not self._xs:
+        if not len(self._xs):
             qt.QMessageBox.information(self, "Информация", "Нет графика")
             return
         file_name = os.path.join(self._dir_name_for_save, ut.create_file_name(".png"))
@@ -452,27 +768,26 @@ class MainWindow(qt.QMainWindow):
                                                    filter="Image files (*.png *.jpg)")[0]
         if file_name:
             self._dir_name_for_save = os.path.dirname(file_name)
-            self.figure.savefig(file_name)
+            self.figure_canvas.draw()
+            self._start_export(file_name, ut.save_image, np.array(self.figure_canvas.buffer_rgba()))
 
     @pyqtSlot()
     def save_result(self):
         """
-        Slot saves solution of equation.
+        Slot saves solution of equation in thread pool. Next calculation
+        allocates new arrays for solution, so exported arrays are not changed
+        during export.
         """
 
-        if not self._xs:
+        if not len(self._xs):
             qt.QMessageBox.information(self, "Информация", "Нет решения")
             return
         file_name = os.path.join(self._dir_name_for_save, ut.create_file_name(".xlsx"))
         file_name = qt.QFileDialog.getSaveFileName(self, "Сохранить решение в файл", directory=file_name,
-                                                   filter="Text files (*.xlsx *.txt)")[0]
+                                                   filter="Data files (*.xlsx *.txt *.csv *.npy *.npz)")[0]
         if file_name:
             self._dir_name_for_save = os.path.dirname(file_name)
-            extension = os.path.splitext(file_name)[-1]
-            if extension == ".xlsx":
-                ut.save_data_to_excel(file_name, self._xs, self._ys)
-            else:
-                ut.save_data_to_txt(file_name, self._xs, self._ys)
+            self._start_export(file_name, save_solution, *self._solver.get_solution())
 
     @pyqtSlot()
     def set_equation_order(self):
@@ -493,17 +808,12 @@ class MainWindow(qt.QMainWindow):
         :param graph_index: index of graph to show.
         """
 
-        if not self._xs or graph_index >= len(self._ys[0]):
-            self.figure.clear()
-            self.figure_canvas.draw()
-            return
-        y_label = f"d{graph_index}Y/dX" if graph_index else "Y"
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        ax.plot(self._xs, [y[graph_index] for y in self._ys], color="blue")
-        ax.set_xlabel("X")
-        ax.set_ylabel(y_label)
-        self.figure_canvas.draw()
+        for index, line in enumerate(self._lines):
+            line.set_visible(index == graph_index)
+        self._axes.set_ylabel(f"d{graph_index}Y/dX" if graph_index else "Y")
+        self._axes.relim(visible_only=True)
+        self._axes.autoscale_view()
+        self.figure_canvas.draw_idle()
 
     @pyqtSlot()
     def start_calculation(self):
@@ -523,9 +833,20 @@ class MainWindow(qt.QMainWindow):
                             if line_edit.isVisible()]
             free_argument = float(self.line_edit_free_argument.text())
             limits = self.spin_box_x_min.value(), self.spin_box_x_max.value()
-            self.calculation_started.emit(SolutionMethod.RUNGE_KUTTA, accuracy, coefficients, free_argument, borders,
-                                          limits)
+            solution_method = self.combo_box_method.currentData()
+            self._solver.number_of_workers = self.spin_box_workers.value()
+            self._solver.profile_dir_name = self._dir_name_for_save if self.check_box_profile.isChecked() else None
+            self.calculation_started.emit(solution_method, accuracy, coefficients, free_argument, borders, limits)
             self._enable_widgets(False)
         else:
             qt.QMessageBox.warning(self, "Предупреждение", "Введите все значения коэффициентов в уравнении и граничные"
                                                            " значения")
+
+    @pyqtSlot()
+    def stop_calculation(self):
+        """
+        Method stops calculation.
+        """
+
+        self.calculation_stopped.emit()
+        self.text_edit.append("Calculation stopped")
@@ -5,8 +5,9 @@ File with useful functions.
 import os
 import sys
 from datetime import datetime
-from typing import List
-import pandas as pd
+import numpy as np
+from matplotlib.image import imsave
+from solution.progress import Progress
 
 
 def create_file_name(extension: str):
@@ -32,27 +33,18 @@ def get_dir_name() -> str:
     return path
 
 
-def save_data_to_excel(file_name: str, xs: List[float], ys: List[List[float]]):
+def save_image(file_name: str, image: np.ndarray, progress: Progress = None):
     """
-    Function saves data to excel file.
-    :param file_name: name of file to save data;
-    :param xs:
-    :param ys:
+    Function saves image of figure rendered in main thread to file. Format of
+    file is given by its extension.
+    :param file_name: name of file;
+    :param image: array with RGBA values of pixels;
+    :param progress: object to stop export.
     """
 
-    y_data = {f"y{index}": [y[index] for y in ys] for index in range(len(ys[0]))}
-    data = pd.DataFrame({"x": xs, **y_data})
-    data.to_excel(file_name, engine="xlsxwriter")
-
-
-def save_data_to_txt(file_name: str, xs: List[float], ys: List[List[float]]):
-    """
-    Function saves data to txt file.
-    :param file_name: name of file to save data;
-    :param xs:
-    :param ys:
-    """
-
-    with open(file_name, "w", encoding="utf-8") as file:
-        for index in range(len(xs)):
-            file.write(f"{xs[index]:.5f}{'  '.join(map(str, ys[index]))}\n")
+    progress = progress or Progress()
+    progress.start(1)
+    progress.update(0)
+    if os.path.splitext(file_name)[-1].lower() in (".jpg", ".jpeg"):
+        image = image[:, :, :3]
+    imsave(file_name, image)
@@ -2,12 +2,14 @@
 File to start application.
 """
 
+import multiprocessing
 import sys
 from PyQt5.QtWidgets import QApplication
 from gui import MainWindow
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
@@ -1,3 +1,5 @@
-from solution.solver import SolutionMethod, Solver
+from solution.batch import solve_batch
+from solution.core import SolutionMethod, SolverCore
+from solution.exact import ExactSolution
 
-__all__ = ["SolutionMethod", "Solver"]
+__all__ = ["ExactSolution", "SolutionMethod", "SolverCore", "solve_batch"]
@@ -0,0 +1,158 @@
+"""
+File with functions to solve many differential equations in one call.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+import numpy as np
+from solution.companion import create_companion_matrix, create_grid
+from solution.runge_kutta import RungeKutta
+from solution.vectorized_runge_kutta import VectorizedRungeKutta
+
+BLOCK_SIZE: int = 64
+
+
+def _create_propagators(matrices: np.ndarray, free_vectors: np.ndarray, step: float) -> np.ndarray:
+    """
+    Function creates matrices G = [[P, c], [0, 1]] of one step of Runge-Kutta
+    method for stacked equations of the same order.
+    :param matrices: companion matrices of equations;
+    :param free_vectors: free vectors of equations;
+    :param step: step.
+    :return: stacked matrices G.
+    """
+
+    number_of_equations, equation_order = free_vectors.shape
+    stage_matrices = [matrices]
+    stage_vectors = [free_vectors]
+    for node in VectorizedRungeKutta.NODES[1:]:
+        stage_matrices.append(matrices + node * step * matrices @ stage_matrices[-1])
+        stage_vectors.append(free_vectors + node * step * np.einsum("gij,gj->gi", matrices, stage_vectors[-1]))
+    weights = step * VectorizedRungeKutta.WEIGHTS
+    propagators = np.zeros((number_of_equations, equation_order + 1, equation_order + 1))
+    propagators[:, :-1, :-1] = np.eye(equation_order) + np.tensordot(weights, stage_matrices, axes=1)
+    propagators[:, :-1, -1] = np.tensordot(weights, stage_vectors, axes=1)
+    propagators[:, -1, -1] = 1
+    return propagators
+
+
+def _integrate_group(coefficients: np.ndarray, free_arguments: np.ndarray, borders: np.ndarray,
+                     limits: Tuple[float, float], step: float) -> np.ndarray:
+    """
+    Function integrates equations of the same order with given step by
+    Runge-Kutta method. Solution is calculated by blocks of points, every block
+    is one batched matrix product. Function can be executed in worker process.
+    :param coefficients: coefficients of equations in rows;
+    :param free_arguments: free arguments of equations;
+    :param borders: values of border equations in rows;
+    :param limits: segment in which to find solutions;
+    :param step: step.
+    :return: array of shape (number of equations, number of points, order of
+    equations) with solutions.
+    """
+
+    xs = create_grid(*limits, step)
+    number_of_equations, equation_order = borders.shape
+    matrices = np.stack([create_companion_matrix(row) for row in coefficients])
+    free_vectors = np.zeros((number_of_equations, equation_order))
+    free_vectors[:, -1] = free_arguments
+    propagator = _create_propagators(matrices, free_vectors, step)
+    block_size = min(BLOCK_SIZE, len(xs) - 1)
+    powers = np.empty((block_size, *propagator.shape))
+    powers[0] = propagator
+    for index in range(1, block_size):
+        powers[index] = powers[index - 1] @ propagator
+    variables = np.empty((number_of_equations, len(xs), equation_order + 1))
+    variables[:, 0, :-1] = borders
+    variables[:, 0, -1] = 1
+    number_of_segments = len(xs) - 1
+    for start in range(0, number_of_segments, block_size):
+        number = min(block_size, number_of_segments - start)
+        variables[:, start + 1:start + number + 1] = np.einsum("bgij,gj->gbi", powers[:number], variables[:, start])
+    return variables[:, :, :-1]
+
+
+def _analyze_input_data(coefficients: np.ndarray) -> Dict[int, List[int]]:
+    """
+    Function determines orders of equations and groups equations by order.
+    Trailing zero coefficients are dropped as in Solver.analyze_input_data.
+    :param coefficients: coefficients of equations in rows.
+    :return: dictionary with orders of equations and indices of equations.
+    """
+
+    groups = {}
+    for index, row in enumerate(coefficients):
+        non_zero = np.flatnonzero(row)
+        equation_order = int(non_zero[-1]) if len(non_zero) else 0
+        if equation_order < 1:
+            raise ValueError(f"Equation {index} has no derivatives")
+        groups.setdefault(equation_order, []).append(index)
+    return groups
+
+
+def solve_batch(coefficients: np.ndarray, borders: np.ndarray, free_arguments: np.ndarray,
+                limits: Tuple[float, float], accuracy: float,
+                max_number_of_iterations: int = 10, number_of_workers: int = 1
+                ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Function solves many equations on the same segment by Runge-Kutta method.
+    Equations of the same order are integrated together in batched array
+    operations. Step is halved for all equations until accuracy of every
+    equation estimated by Runge rule is not greater than required one. If
+    equations have different orders and number_of_workers is greater than 1
+    then groups of equations are integrated in worker processes.
+    :param coefficients: array of shape (number of equations, max order + 1)
+    with coefficients of equations;
+    :param borders: array of shape (number of equations, max order) with values
+    of border equations;
+    :param free_arguments: array with free arguments of equations;
+    :param limits: segment in which to find solutions;
+    :param accuracy: required accuracy;
+    :param max_number_of_iterations: max number of halvings of step;
+    :param number_of_workers: number of worker processes for groups of
+    equations of different orders.
+    :return: x coordinates, array of shape (number of equations, number of
+    points, max order) with solutions, where derivatives above order of
+    equation are NaN, and array with accuracies of solutions.
+    """
+
+    coefficients = np.atleast_2d(np.asarray(coefficients, dtype=float))
+    borders = np.atleast_2d(np.asarray(borders, dtype=float))
+    free_arguments = np.broadcast_to(np.asarray(free_arguments, dtype=float), (len(coefficients),))
+    groups = _analyze_input_data(coefficients)
+    max_order = max(groups)
+    executor = None
+    if number_of_workers > 1 and len(groups) > 1:
+        executor = ProcessPoolExecutor(min(number_of_workers, len(groups)),
+                                       mp_context=multiprocessing.get_context("spawn"))
+    step = RungeKutta.INITIAL_STEP
+    accuracies = np.full(len(coefficients), -1.0)
+    previous = None
+    try:
+        for _ in range(max_number_of_iterations):
+            tasks = {equation_order: (coefficients[indices, :equation_order + 1], free_arguments[indices],
+                                      borders[indices, :equation_order], limits, step)
+                     for equation_order, indices in groups.items()}
+            if executor is None:
+                results = {equation_order: _integrate_group(*task) for equation_order, task in tasks.items()}
+            else:
+                futures = {equation_order: executor.submit(_integrate_group, *task)
+                           for equation_order, task in tasks.items()}
+                results = {equation_order: future.result() for equation_order, future in futures.items()}
+            xs = create_grid(*limits, step)
+            ys = np.full((len(coefficients), len(xs), max_order), np.nan)
+            for equation_order, indices in groups.items():
+                ys[indices, :, :equation_order] = results[equation_order]
+            if previous is not None:
+                values_for_step = ys[:, ::2, 0]
+                number = min(values_for_step.shape[1], previous.shape[1])
+                accuracies = np.max(np.abs(previous[:, :number, 0] - values_for_step[:, :number]), axis=1) / 15
+                if np.all(accuracies <= accuracy):
+                    break
+            previous = ys
+            step /= 2
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return xs, ys, accuracies
@@ -0,0 +1,204 @@
+"""
+File with cache of solutions of differential equations.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Optional, Tuple
+import numpy as np
+
+
+class SolutionCache:
+    """
+    Class for cache of solutions. Solutions are kept in memory while their
+    total size is less than given budget, least recently used solutions are
+    evicted first. Solutions can be also saved to npz files in given
+    directory, so they are available after restart of application.
+    """
+
+    DEFAULT_MAX_DISK_SIZE: int = 1024 ** 3
+    DEFAULT_MAX_SIZE: int = 256 * 1024 ** 2
+    EXTENSION: str = ".npz"
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, dir_name: str = None,
+                 max_disk_size: int = DEFAULT_MAX_DISK_SIZE):
+        """
+        :param max_size: memory budget of cache in bytes;
+        :param dir_name: directory to save solutions, if None then solutions
+        are not saved to disk;
+        :param max_disk_size: budget of cache on disk in bytes.
+        """
+
+        self._dir_name: str = None
+        self._max_disk_size: int = max_disk_size
+        self._max_size: int = max_size
+        self._size: int = 0
+        self._solutions: OrderedDict = OrderedDict()
+        self.set_dir_name(dir_name)
+
+    @property
+    def size(self) -> int:
+        """
+        :return: size of solutions in memory in bytes.
+        """
+
+        return self._size
+
+    def _evict_from_disk(self):
+        """
+        Method removes least recently used files while size of cache on disk
+        is greater than budget.
+        """
+
+        files = []
+        for file_name in os.listdir(self._dir_name):
+            if file_name.endswith(self.EXTENSION):
+                path = os.path.join(self._dir_name, file_name)
+                files.append((os.path.getmtime(path), os.path.getsize(path), path))
+        disk_size = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if disk_size <= self._max_disk_size:
+                break
+            os.remove(path)
+            disk_size -= size
+
+    def _evict_from_memory(self):
+        """
+        Method removes least recently used solutions from memory while their
+        size is greater than budget.
+        """
+
+        while self._size > self._max_size:
+            self._size -= self._solutions.popitem(last=False)[1][3]
+
+    def _get_file_name(self, key: str) -> str:
+        """
+        Method returns name of file for solution with given key.
+        :param key: key of solution.
+        :return: name of file.
+        """
+
+        return os.path.join(self._dir_name, key + self.EXTENSION)
+
+    def _load(self, key: str) -> Optional[Tuple[np.ndarray, np.ndarray, float]]:
+        """
+        Method loads solution from disk.
+        :param key: key of solution.
+        :return: x coordinates, solution and its accuracy or None if there is no
+        solution on disk.
+        """
+
+        if self._dir_name is None:
+            return None
+        file_name = self._get_file_name(key)
+        try:
+            with np.load(file_name) as data:
+                solution = data["xs"], data["ys"], float(data["accuracy"])
+        except (OSError, KeyError, ValueError):
+            return None
+        os.utime(file_name)
+        return solution
+
+    def _save(self, key: str, xs: np.ndarray, ys: np.ndarray, accuracy: float):
+        """
+        Method saves solution to disk. Solution larger than budget of disk is
+        not saved, otherwise it would evict all other files and then itself.
+        :param key: key of solution;
+        :param xs: x coordinates;
+        :param ys: solution;
+        :param accuracy: accuracy of solution.
+        """
+
+        if self._dir_name is None or xs.nbytes + ys.nbytes > self._max_disk_size:
+            return
+        try:
+            os.makedirs(self._dir_name, exist_ok=True)
+            np.savez(self._get_file_name(key), xs=xs, ys=ys, accuracy=accuracy)
+            self._evict_from_disk()
+        except OSError:
+            pass
+
+    def _store(self, key: str, xs: np.ndarray, ys: np.ndarray, accuracy: float):
+        """
+        Method stores solution in memory and evicts least recently used
+        solutions if memory budget is exceeded.
+        :param key: key of solution;
+        :param xs: x coordinates;
+        :param ys: solution;
+        :param accuracy: accuracy of solution.
+        """
+
+        size = xs.nbytes + ys.nbytes
+        if size > self._max_size:
+            return
+        if key in self._solutions:
+            self._size -= self._solutions.pop(key)[3]
+        self._solutions[key] = xs, ys, accuracy, size
+        self._size += size
+        self._evict_from_memory()
+
+    def clear(self):
+        """
+        Method removes all solutions from memory.
+        """
+
+        self._solutions.clear()
+        self._size = 0
+
+    @staticmethod
+    def create_key(*params) -> str:
+        """
+        Method creates key of solution from parameters of calculation.
+        :param params: parameters that determine solution.
+        :return: key of solution.
+        """
+
+        return hashlib.sha1(repr(params).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[np.ndarray, np.ndarray, float]]:
+        """
+        Method returns solution with given key from memory or from disk.
+        :param key: key of solution.
+        :return: x coordinates, solution and its accuracy or None if there is no
+        solution in cache.
+        """
+
+        if key in self._solutions:
+            self._solutions.move_to_end(key)
+            return self._solutions[key][:3]
+        solution = self._load(key)
+        if solution is not None:
+            self._store(key, *solution)
+        return solution
+
+    def put(self, key: str, xs: np.ndarray, ys: np.ndarray, accuracy: float):
+        """
+        Method puts solution to cache.
+        :param key: key of solution;
+        :param xs: x coordinates;
+        :param ys: solution;
+        :param accuracy: accuracy of solution.
+        """
+
+        xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+        self._store(key, xs, ys, accuracy)
+        self._save(key, xs, ys, accuracy)
+
+    def set_dir_name(self, dir_name: Optional[str]):
+        """
+        Method sets directory to save solutions.
+        :param dir_name: directory, if None then solutions are not saved to
+        disk.
+        """
+
+        self._dir_name = dir_name
+
+    def set_max_size(self, max_size: int):
+        """
+        Method sets memory budget of cache.
+        :param max_size: budget in bytes.
+        """
+
+        self._max_size = max_size
+        self._evict_from_memory()
@@ -0,0 +1,56 @@
+"""
+File with functions to represent linear differential equation with constant
+coefficients as system of first order equations.
+"""
+
+import math
+from typing import List
+import numpy as np
+
+
+def create_companion_matrix(coefficients: List[float]) -> np.ndarray:
+    """
+    Function creates companion matrix of differential equation. Equation of
+    order n is written as system y' = A y + b for vector of variables
+    y = (y, dy/dx, ..., dy^(n-1)/dx^(n-1)).
+    :param coefficients: coefficients of equation.
+    :return: matrix A of system.
+    """
+
+    equation_order = len(coefficients) - 1
+    matrix = np.eye(equation_order, k=1)
+    matrix[-1, :] = -np.asarray(coefficients[:-1], dtype=float) / coefficients[-1]
+    return matrix
+
+
+def create_free_vector(equation_order: int, free_argument: float) -> np.ndarray:
+    """
+    Function creates vector b of system y' = A y + b. Free argument enters
+    equation for highest derivative in the same way as in RungeKutta solver.
+    :param equation_order: order of equation;
+    :param free_argument: free argument of equation.
+    :return: vector b of system.
+    """
+
+    vector = np.zeros(equation_order)
+    vector[-1] = free_argument
+    return vector
+
+
+def create_grid(min_x: float, max_x: float, step: float) -> np.ndarray:
+    """
+    Function creates x coordinates of integration points. Coordinates are
+    accumulated step by step exactly as in RungeKutta solver, so the last point
+    is the first one that is greater than max_x.
+    :param min_x: start of segment;
+    :param max_x: end of segment;
+    :param step: step of integration.
+    :return: array with x coordinates.
+    """
+
+    number_of_points = math.floor((max_x - min_x) / step) + 3
+    increments = np.full(number_of_points, step)
+    increments[0] = min_x
+    xs = np.add.accumulate(increments)
+    number_of_points = np.argmax(xs > max_x) + 1
+    return xs[:number_of_points]
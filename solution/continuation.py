@@ -0,0 +1,76 @@
+"""
+File with class to continue solution of differential equation when segment
+is changed.
+"""
+
+from typing import Tuple
+import numpy as np
+from solution.trajectory import create_trajectory
+
+
+class Continuation:
+    """
+    Class for checkpoint of converged solution. If only right end of segment is
+    changed then solution on new segment is found from checkpoint: it is
+    sliced if segment is narrowed and integrated from the last point if
+    segment is extended.
+    """
+
+    def __init__(self, key: tuple, xs: np.ndarray, ys: np.ndarray, step: float, accuracy: float):
+        """
+        :param key: parameters of equation except right end of segment;
+        :param xs: x coordinates of solution;
+        :param ys: solution;
+        :param step: step with which solution converged;
+        :param accuracy: accuracy of solution.
+        """
+
+        self.accuracy: float = accuracy
+        self.key: tuple = key
+        self.step: float = step
+        self.xs: np.ndarray = np.asarray(xs, dtype=float)
+        self.ys: np.ndarray = np.asarray(ys, dtype=float)
+
+    @property
+    def last_point(self) -> Tuple[float, np.ndarray]:
+        """
+        :return: x coordinate and solution in last point.
+        """
+
+        return float(self.xs[-1]), self.ys[-1]
+
+    def contains(self, max_x: float) -> bool:
+        """
+        Method checks whether solution covers segment with given right end.
+        :param max_x: right end of segment.
+        :return: True if solution covers segment.
+        """
+
+        return max_x <= self.xs[-1]
+
+    def extend(self, xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Method joins solution with its continuation that starts in last point.
+        Joined solution is allocated as trajectory of integration, so large
+        solution is mapped to file and is not read into memory at once.
+        :param xs: x coordinates of continuation;
+        :param ys: continuation of solution.
+        :return: x coordinates and joined solution.
+        """
+
+        number_of_points = len(self.xs)
+        joined_ys = create_trajectory(number_of_points + len(ys) - 1, self.ys.shape[1])
+        joined_ys[:number_of_points] = self.ys
+        joined_ys[number_of_points:] = ys[1:]
+        return np.concatenate((self.xs, np.asarray(xs, dtype=float)[1:])), joined_ys
+
+    def slice(self, max_x: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Method returns solution on narrowed segment. As in integration, the last
+        point is the first one that is greater than right end of segment.
+        :param max_x: right end of segment.
+        :return: x coordinates and solution.
+        """
+
+        number = int(np.searchsorted(self.xs, max_x, side="right")) + 1
+        return self.xs[:number], self.ys[:number]
@@ -0,0 +1,536 @@
+"""
+File with main solver of differential equation without dependency on Qt.
+"""
+
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from enum import auto, Enum
+from multiprocessing.managers import SyncManager
+from threading import Event
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from solution.cache import SolutionCache
+from solution.continuation import Continuation
+from solution.decimation import decimate, DecimationMethod
+from solution.dense_output import DenseOutput
+from solution.dormand_prince import DormandPrince
+from solution.exact import ExactSolver
+from solution.implicit import BackwardDifferentiation, Rosenbrock
+from solution.lockstep import LockstepRungeKutta
+from solution.metrics import CalculationMetrics, Profiler
+from solution.parareal import Parareal
+from solution.progress import CalculationStopped, Progress
+from solution.pyramid import MinMaxPyramid
+from solution.propagator import LinearPropagator
+from solution.runge_kutta import RungeKutta
+from solution.speculation import solve_for_steps
+from solution.superposition import Superposition
+from solution.vectorized_runge_kutta import VectorizedRungeKutta
+
+
+class SolutionMethod(Enum):
+    """
+    Class with methods of solution of differential equation.
+    """
+
+    BACKWARD_DIFFERENTIATION = auto()
+    DORMAND_PRINCE = auto()
+    EULER = auto()
+    EXACT = auto()
+    LINEAR_PROPAGATOR = auto()
+    LOCKSTEP_RUNGE_KUTTA = auto()
+    PARAREAL = auto()
+    ROSENBROCK = auto()
+    RUNGE_KUTTA = auto()
+    VECTORIZED_RUNGE_KUTTA = auto()
+
+
+class SolverCore:
+    """
+    Class to solve differential equation. Events of calculation are reported
+    by calling functions given in attributes with "on_" prefix.
+    """
+
+    MAX_NUMBER_OF_POINTS: int = 500
+    MAX_NUMBER_OF_ITERATIONS: int = 10
+    MAX_NUMBER_OF_SUPERPOSITIONS: int = 8
+    MAX_SUPERPOSITION_SIZE: int = 256 * 1024 ** 2
+
+    def __init__(self):
+        self._coefficients: List[float] = None
+        self._continuation: Continuation = None
+        self._executor: ProcessPoolExecutor = None
+        self._executor_workers: int = 0
+        self._free_argument: float = 0
+        self._manager: SyncManager = None
+        self._progress: Progress = Progress(self._report_progress, chunk_callback=self._report_chunk,
+                                            max_number_of_points=self.MAX_NUMBER_OF_POINTS)
+        self._step: float = None
+        self._stop_event: Event = None
+        self._superposition_steps: Dict[tuple, float] = {}
+        self._superpositions: Dict[tuple, Superposition] = {}
+        self.accuracy: float = -1
+        self.cache: SolutionCache = SolutionCache()
+        self.decimation_method: DecimationMethod = DecimationMethod.MIN_MAX
+        self.metrics: CalculationMetrics = CalculationMetrics()
+        self.number_of_workers: int = 1
+        self.on_cache_checked: Callable[[bool], None] = self._do_nothing
+        self.on_calculation_finished: Callable[[], None] = self._do_nothing
+        self.on_chunk_calculated: Callable[[np.ndarray, np.ndarray], None] = self._do_nothing
+        self.on_calculation_for_step_finished: Callable[[np.ndarray, np.ndarray, float], None] = self._do_nothing
+        self.on_calculation_for_step_started: Callable[[int, float], None] = self._do_nothing
+        self.on_calculation_started: Callable[[list, list], None] = self._do_nothing
+        self.on_max_iterations_used: Callable[[int], None] = self._do_nothing
+        self.on_metrics_collected: Callable[[CalculationMetrics], None] = self._do_nothing
+        self.on_progress_changed: Callable[[float, float, float], None] = self._do_nothing
+        self.on_pyramid_built: Callable[[MinMaxPyramid], None] = self._do_nothing
+        self.on_steps_counted: Callable[[int, int], None] = self._do_nothing
+        self.profile_dir_name: Optional[str] = None
+        self.solvers: Dict[SolutionMethod, RungeKutta] = {
+            SolutionMethod.BACKWARD_DIFFERENTIATION: BackwardDifferentiation(),
+            SolutionMethod.DORMAND_PRINCE: DormandPrince(),
+            SolutionMethod.EXACT: ExactSolver(),
+            SolutionMethod.LINEAR_PROPAGATOR: LinearPropagator(),
+            SolutionMethod.LOCKSTEP_RUNGE_KUTTA: LockstepRungeKutta(),
+            SolutionMethod.PARAREAL: Parareal(),
+            SolutionMethod.ROSENBROCK: Rosenbrock(),
+            SolutionMethod.RUNGE_KUTTA: RungeKutta(),
+            SolutionMethod.VECTORIZED_RUNGE_KUTTA: VectorizedRungeKutta()}
+        self.solution_accuracy: Optional[float] = None
+        self.solver: RungeKutta = None
+        self.xs: List[float] = None
+        self.ys: List[List[float]] = None
+
+    def _calculate(self, solution_method: SolutionMethod, accuracy: float, coefficients: List[float],
+                   free_argument: float, borders: List[float], limits: Tuple[int]) -> Optional[float]:
+        """
+        Method solves differential equation by cache, superposition,
+        continuation or integration.
+        :param solution_method: method to solve equation;
+        :param accuracy: required solution accuracy;
+        :param coefficients: coefficients in equation;
+        :param free_argument: free argument in equation;
+        :param borders: values in border equations;
+        :param limits: segment in which to find solution.
+        :return: accuracy of solution or None if required accuracy was not
+        reached.
+        """
+
+        self.accuracy = accuracy
+        self._progress.reset()
+        self.solution_accuracy = None
+        coefficients, borders = self.analyze_input_data(coefficients, borders)
+        self._coefficients, self._free_argument = coefficients, free_argument
+        self.on_calculation_started(coefficients, borders)
+        self.solver = self.solvers[solution_method]
+        cache_key = self.cache.create_key(solution_method.name, coefficients, free_argument, borders, limits,
+                                          accuracy)
+        if self._solve_by_cache(cache_key):
+            return self.solution_accuracy
+        key = solution_method, tuple(coefficients), tuple(limits), accuracy
+        if self._solve_by_superposition(key, cache_key, coefficients, free_argument, borders, limits):
+            return self.solution_accuracy
+        continuation_key = solution_method, tuple(coefficients), free_argument, tuple(borders), limits[0], accuracy
+        if self._continuation is not None and self._continuation.key == continuation_key:
+            self._solve_by_continuation(cache_key, coefficients, free_argument, limits[1])
+            return self.solution_accuracy
+        self.solver.set_data(coefficients, free_argument, borders, limits, self._progress,
+                             self._report_start_of_step)
+        self.solver.set_accuracy(accuracy)
+        if isinstance(self.solver, Parareal):
+            self.solver.set_number_of_workers(self.number_of_workers)
+            current_accuracy = self._run_iterations()
+        elif self.number_of_workers > 1 and self.solver.FIXED_STEP:
+            current_accuracy = self._run_speculative_iterations(coefficients, free_argument, borders, limits)
+        else:
+            current_accuracy = self._run_iterations()
+        if current_accuracy is None:
+            self.on_calculation_finished()
+            return None
+        self._continuation = Continuation(continuation_key, self.xs, self.ys, self._step, current_accuracy)
+        self.solution_accuracy = current_accuracy
+        self.cache.put(cache_key, self.xs, self.ys, current_accuracy)
+        self.on_calculation_finished()
+        if self.solver.FIXED_STEP and key not in self._superpositions:
+            self._superposition_steps.pop(key, None)
+            if len(self._superposition_steps) >= self.MAX_NUMBER_OF_SUPERPOSITIONS:
+                self._superposition_steps.pop(next(iter(self._superposition_steps)))
+            self._superposition_steps[key] = self._step
+        return current_accuracy
+
+    def _create_superposition(self, key: tuple, coefficients: List[float], free_argument: float,
+                              borders: List[float], limits: Tuple[int]) -> bool:
+        """
+        Method finds basis solutions for step of converged solution of equation
+        and saves them to cache, so that solution for new values of border
+        equations and free argument can be found without integration. Basis is
+        found only when equation is solved again with other values of border
+        equations or free argument, calculation of basis can be stopped.
+        :param key: key of equation in cache;
+        :param coefficients: coefficients in equation;
+        :param free_argument: free argument in equation;
+        :param borders: values in border equations;
+        :param limits: segment in which to find solution.
+        :return: True if basis solutions were found.
+        """
+
+        step = self._superposition_steps.pop(key)
+        equation_order = len(coefficients) - 1
+        number_of_points = (limits[1] - limits[0]) / step + 2
+        size = 1.5 * number_of_points * equation_order * (equation_order + 1) * np.dtype(float).itemsize
+        if size > self.MAX_SUPERPOSITION_SIZE:
+            return False
+        self.solver.set_data(coefficients, free_argument, borders, limits, self._progress,
+                             self._report_start_of_step)
+        self._progress.set_chunk_callback(None)
+        number_of_steps, number_of_evaluations = self.solver.number_of_steps, self.solver.number_of_evaluations
+        try:
+            xs, basis = self.solver.solve_for_basis(step)
+            _, basis_for_2step = self.solver.solve_for_basis(2 * step)
+        except CalculationStopped:
+            return False
+        finally:
+            self._progress.set_chunk_callback(self._report_chunk)
+            self.metrics.add_steps(self.solver.number_of_steps - number_of_steps,
+                                   self.solver.number_of_evaluations - number_of_evaluations)
+        if len(self._superpositions) >= self.MAX_NUMBER_OF_SUPERPOSITIONS:
+            self._superpositions.pop(next(iter(self._superpositions)))
+        self._superpositions[key] = Superposition(xs, basis, basis_for_2step, self.solver.check_accuracy)
+        return True
+
+    @staticmethod
+    def _do_nothing(*args):
+        """
+        Method is called for events without handlers.
+        """
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        Method returns executor with worker processes for speculative
+        calculation. Processes are started by spawn method, since fork is not
+        safe in application with threads. Manager process for events that stop
+        solutions in worker processes is started with executor.
+        :return: executor.
+        """
+
+        context = multiprocessing.get_context("spawn")
+        if self._executor is None or self._executor_workers != self.number_of_workers:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = ProcessPoolExecutor(self.number_of_workers, mp_context=context)
+            self._executor_workers = self.number_of_workers
+        if self._manager is None:
+            self._manager = context.Manager()
+        return self._executor
+
+    def _report_chunk(self, xs: np.ndarray, ys: np.ndarray):
+        """
+        Method reports chunk of solution calculated during integration.
+        :param xs: x coordinates of chunk;
+        :param ys: solution in chunk.
+        """
+
+        start_time = time.perf_counter()
+        self.on_chunk_calculated(xs, ys)
+        self.metrics.emission_time += time.perf_counter() - start_time
+
+    def _report_progress(self, fraction: float, speed: float, time_left: float):
+        """
+        Method reports progress of integration.
+        :param fraction: fraction of integrated segment;
+        :param speed: number of steps per second;
+        :param time_left: estimated time to finish integration in seconds.
+        """
+
+        start_time = time.perf_counter()
+        self.on_progress_changed(fraction, speed, time_left)
+        self.metrics.emission_time += time.perf_counter() - start_time
+
+    def _report_solution(self, accuracy: float):
+        """
+        Method reports decimated solution. Full solution stays in attributes xs
+        and ys. For solution with many points pyramid of min and max values is
+        also reported to show parts of solution in detail. Solution with few
+        points is reported on uniform grid of dense output, so that graph is
+        smooth for large steps.
+        :param accuracy: accuracy of solution.
+        """
+
+        start_time = time.perf_counter()
+        all_xs, all_ys = np.asarray(self.xs), np.asarray(self.ys)
+        if 1 < len(all_xs) < self.MAX_NUMBER_OF_POINTS:
+            xs = np.linspace(all_xs[0], all_xs[-1], self.MAX_NUMBER_OF_POINTS)
+            ys = self.get_dense_output().evaluate(xs)
+        else:
+            xs, ys = decimate(all_xs, all_ys, self.MAX_NUMBER_OF_POINTS, self.decimation_method)
+        self.on_calculation_for_step_finished(xs, ys, accuracy)
+        if len(all_xs) > self.MAX_NUMBER_OF_POINTS:
+            self.on_pyramid_built(MinMaxPyramid(all_xs, all_ys))
+        self.metrics.emission_time += time.perf_counter() - start_time
+
+    def _report_start_of_step(self, iteration_number: int, step: float):
+        """
+        Method reports that integration of equation with given step was started.
+        :param iteration_number: number of iteration;
+        :param step: step.
+        """
+
+        start_time = time.perf_counter()
+        self.on_calculation_for_step_started(iteration_number, step)
+        self.metrics.emission_time += time.perf_counter() - start_time
+
+    def _run_iterations(self, continuation: Continuation = None) -> Optional[float]:
+        """
+        Method solves equation with decreasing step until required accuracy is
+        reached.
+        :param continuation: checkpoint of solution if equation is integrated
+        from its last point.
+        :return: accuracy of solution or None if required accuracy was not
+        reached.
+        """
+
+        while True:
+            start_time = time.perf_counter()
+            number_of_steps, number_of_evaluations = self.solver.number_of_steps, self.solver.number_of_evaluations
+            try:
+                iteration_number, current_accuracy, self.xs, self.ys = self.solver.solve()
+            except CalculationStopped:
+                return None
+            self.metrics.add_iteration(time.perf_counter() - start_time, self.solver.number_of_steps - number_of_steps,
+                                       self.solver.number_of_evaluations - number_of_evaluations)
+            self._step = self.solver.step
+            if continuation is not None:
+                self.xs, self.ys = continuation.extend(self.xs, self.ys)
+            self._report_solution(current_accuracy)
+            if isinstance(self.solver, DormandPrince):
+                self.on_steps_counted(self.solver.accepted_steps, self.solver.rejected_steps)
+            if current_accuracy != -1 and current_accuracy <= self.accuracy:
+                return current_accuracy
+            if iteration_number >= self.MAX_NUMBER_OF_ITERATIONS:
+                self.on_max_iterations_used(iteration_number)
+                return None
+
+    def _run_speculative_iterations(self, coefficients: List[float], free_argument: float, borders: List[float],
+                                    limits: Tuple[int]) -> Optional[float]:
+        """
+        Method solves equation for several decreasing steps at once in worker
+        processes. Accuracy is estimated for neighbouring steps as soon as their
+        solutions are ready, steps that are not needed any more are cancelled.
+        :param coefficients: coefficients in equation;
+        :param free_argument: free argument in equation;
+        :param borders: values in border equations;
+        :param limits: segment in which to find solution.
+        :return: accuracy of solution or None if required accuracy was not
+        reached.
+        """
+
+        executor = self._get_executor()
+        steps = [self.solver.INITIAL_STEP / 2 ** power for power in range(self.MAX_NUMBER_OF_ITERATIONS)]
+        self._stop_event = self._manager.Event()
+        if self._progress.stopped:
+            self._stop_event.set()
+        solutions = solve_for_steps(executor, self.number_of_workers, type(self.solver), coefficients, free_argument,
+                                    borders, limits, steps, self._stop_event)
+        variables_for_2step = None
+        start_time = time.perf_counter()
+        try:
+            for iteration_number, solution in enumerate(solutions, 1):
+                if self._progress.stopped:
+                    return None
+                step, xs, variables, number_of_steps, number_of_evaluations = solution
+                self.metrics.add_iteration(time.perf_counter() - start_time, number_of_steps, number_of_evaluations)
+                self._report_start_of_step(iteration_number, step)
+                if variables_for_2step is None:
+                    current_accuracy = -1
+                else:
+                    current_accuracy = self.solver.check_accuracy(variables, variables_for_2step)
+                self.xs, self.ys, self._step = xs, variables, step
+                variables_for_2step = variables
+                self._report_solution(current_accuracy)
+                if current_accuracy != -1 and current_accuracy <= self.accuracy:
+                    return current_accuracy
+                start_time = time.perf_counter()
+        finally:
+            solutions.close()
+            self._stop_event = None
+        if self._progress.stopped:
+            return None
+        self.on_max_iterations_used(self.MAX_NUMBER_OF_ITERATIONS)
+        return None
+
+    def _solve_by_cache(self, key: str) -> bool:
+        """
+        Method takes solution from cache.
+        :param key: key of solution in cache.
+        :return: True if solution was found in cache.
+        """
+
+        solution = self.cache.get(key)
+        self.on_cache_checked(solution is not None)
+        if solution is None:
+            return False
+        self.xs, self.ys, current_accuracy = solution
+        self.solution_accuracy = current_accuracy
+        self._report_solution(current_accuracy)
+        self.on_calculation_finished()
+        return True
+
+    def _solve_by_continuation(self, cache_key: str, coefficients: List[float], free_argument: float, max_x: int):
+        """
+        Method finds solution from checkpoint of previous solution with the same
+        left end of segment. Solution is sliced if segment is narrowed and is
+        integrated from its last point if segment is extended.
+        :param cache_key: key of solution in cache of solutions;
+        :param coefficients: coefficients in equation;
+        :param free_argument: free argument in equation;
+        :param max_x: right end of segment.
+        """
+
+        continuation = self._continuation
+        if continuation.contains(max_x):
+            self.xs, self.ys = continuation.slice(max_x)
+            current_accuracy = continuation.accuracy
+            self._report_solution(current_accuracy)
+        else:
+            x, borders = continuation.last_point
+            self.solver.set_data(coefficients, free_argument, borders.tolist(), (x, max_x), self._progress,
+                                 self._report_start_of_step)
+            self.solver.set_accuracy(self.accuracy)
+            self.solver.set_step(2 * continuation.step)
+            current_accuracy = self._run_iterations(continuation)
+            if current_accuracy is None:
+                self.on_calculation_finished()
+                return
+            current_accuracy = max(current_accuracy, continuation.accuracy)
+            self._continuation = Continuation(continuation.key, self.xs, self.ys, self._step, current_accuracy)
+        self.solution_accuracy = current_accuracy
+        self.cache.put(cache_key, self.xs, self.ys, current_accuracy)
+        self.on_calculation_finished()
+
+    def _solve_by_superposition(self, key: tuple, cache_key: str, coefficients: List[float], free_argument: float,
+                                borders: List[float], limits: Tuple[int]) -> bool:
+        """
+        Method finds solution as combination of basis solutions from cache. If
+        equation was solved before with other values of border equations or
+        free argument then basis solutions are found first.
+        :param key: key of equation in cache of basis solutions;
+        :param cache_key: key of solution in cache of solutions;
+        :param coefficients: coefficients in equation;
+        :param free_argument: free argument in equation;
+        :param borders: values in border equations;
+        :param limits: segment in which to find solution.
+        :return: True if solution with required accuracy was found.
+        """
+
+        if key in self._superposition_steps and not self._create_superposition(key, coefficients, free_argument,
+                                                                               borders, limits):
+            return False
+        superposition = self._superpositions.get(key)
+        if superposition is None:
+            return False
+        xs, ys, current_accuracy = superposition.combine(borders, free_argument)
+        if current_accuracy > self.accuracy:
+            return False
+        self.xs, self.ys = xs, ys
+        self.solution_accuracy = current_accuracy
+        self.cache.put(cache_key, self.xs, self.ys, current_accuracy)
+        self._report_solution(current_accuracy)
+        self.on_calculation_finished()
+        return True
+
+    @staticmethod
+    def analyze_input_data(coefficients: List[float], borders: List[float]) -> Tuple[List[float], List[float]]:
+        """
+        Method analyzes input data of equation and determines order of equation.
+        :param coefficients: coefficients in equation;
+        :param borders: values in border equations.
+        :return: correct coefficients in equation and values in border equations.
+        """
+
+        for index in range(len(coefficients) - 1, -1, -1):
+            if coefficients[index] != 0:
+                break
+            coefficients.pop(index)
+            borders.pop(index - 1)
+        return coefficients, borders
+
+    def get_dense_output(self) -> DenseOutput:
+        """
+        Method returns continuous extension of last solution.
+        :return: dense output of solution.
+        """
+
+        return DenseOutput(np.asarray(self.xs), np.asarray(self.ys), self._coefficients, self._free_argument)
+
+    def sample(self, grid: np.ndarray) -> np.ndarray:
+        """
+        Method evaluates last solution in given x coordinates, for example on
+        grid of plot or on grid with fixed spacing for export. Solution is
+        integrated with step required by accuracy and is interpolated between
+        points of integration.
+        :param grid: x coordinates inside segment of solution.
+        :return: array with values of y and its derivatives in rows.
+        """
+
+        return self.get_dense_output().evaluate(grid)
+
+    def shutdown_workers(self):
+        """
+        Method stops worker processes of speculative calculation and of
+        Parareal method.
+        """
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            self._executor_workers = 0
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+        self.solvers[SolutionMethod.PARAREAL].shutdown_workers()
+
+    def start_calculation(self, solution_method: SolutionMethod, accuracy: float, coefficients: List[float],
+                          free_argument: float, borders: List[float], limits: Tuple[int]) -> Optional[float]:
+        """
+        Method solves differential equation. Metrics of calculation are
+        reported after calculation. If directory for profile is set then
+        calculation is profiled and statistics are saved to this directory.
+        :param solution_method: method to solve equation;
+        :param accuracy: required solution accuracy;
+        :param coefficients: coefficients in equation;
+        :param free_argument: free argument in equation;
+        :param borders: values in border equations;
+        :param limits: segment in which to find solution.
+        :return: accuracy of solution or None if required accuracy was not
+        reached.
+        """
+
+        self.metrics = CalculationMetrics()
+        start_time = time.perf_counter()
+        if self.profile_dir_name:
+            profiler = Profiler(self.profile_dir_name)
+            with profiler:
+                current_accuracy = self._calculate(solution_method, accuracy, coefficients, free_argument, borders,
+                                                   limits)
+            self.metrics.profile_file_names = profiler.file_names
+        else:
+            current_accuracy = self._calculate(solution_method, accuracy, coefficients, free_argument, borders,
+                                               limits)
+        self.metrics.calculation_time = time.perf_counter() - start_time
+        if self.xs is not None:
+            self.metrics.trajectory_memory = np.asarray(self.xs).nbytes + np.asarray(self.ys).nbytes
+        self.on_metrics_collected(self.metrics)
+        return current_accuracy
+
+    def stop_calculation(self):
+        """
+        Method stops calculation. It can be called from any thread, integration
+        loop stops at its next check of progress. Speculative solutions in
+        worker processes are stopped by shared event.
+        """
+
+        self._progress.stop()
+        stop_event = self._stop_event
+        if stop_event is not None:
+            stop_event.set()
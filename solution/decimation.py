@@ -0,0 +1,113 @@
+"""
+File with functions to decimate solution for plotting so that peaks of solution
+are kept.
+"""
+
+from enum import auto, Enum
+from typing import Tuple
+import numpy as np
+
+MIN_NUMBER_OF_POINTS_FOR_COLUMN: int = 4
+
+
+class DecimationMethod(Enum):
+    """
+    Class with methods of decimation of solution.
+    """
+
+    LTTB = auto()
+    MIN_MAX = auto()
+
+
+def _get_bucket_bounds(number_of_values: int, number_of_buckets: int) -> np.ndarray:
+    """
+    Function splits values into buckets of almost equal size.
+    :param number_of_values: number of values;
+    :param number_of_buckets: number of buckets.
+    :return: indices of first values of buckets and index after last value.
+    """
+
+    return np.linspace(0, number_of_values, number_of_buckets + 1).round().astype(int)
+
+
+def decimate(xs: np.ndarray, ys: np.ndarray, number_of_points: int,
+             method: DecimationMethod = DecimationMethod.MIN_MAX) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Function decimates solution. Number of points is divided between columns
+    of solution, points are selected for every column separately and solution
+    is returned in union of selected points, so that every column keeps its
+    shape and number of returned points is not greater than given. If there
+    are too few points for every column, points are selected evenly.
+    :param xs: x coordinates;
+    :param ys: array with values of y and its derivatives in rows;
+    :param number_of_points: max number of points to select;
+    :param method: method of decimation.
+    :return: x coordinates and values in selected points.
+    """
+
+    if len(xs) <= number_of_points:
+        return xs, ys
+    columns = ys.reshape(len(ys), -1).T
+    number_of_points_for_column = number_of_points // max(1, len(columns))
+    if number_of_points_for_column < MIN_NUMBER_OF_POINTS_FOR_COLUMN:
+        indices = np.unique(np.linspace(0, len(xs) - 1, number_of_points).round().astype(int))
+        return xs[indices], ys[indices]
+    select = select_by_lttb if method == DecimationMethod.LTTB else select_by_min_max
+    indices = np.unique(np.concatenate([select(xs, column, number_of_points_for_column) for column in columns]))
+    return xs[indices], ys[indices]
+
+
+def select_by_lttb(xs: np.ndarray, ys: np.ndarray, number_of_points: int) -> np.ndarray:
+    """
+    Function selects points by Largest-Triangle-Three-Buckets algorithm. First
+    and last points are always selected, other points are split into buckets
+    and from every bucket the point is selected that makes the largest triangle
+    with point selected in previous bucket and average point of next bucket.
+    :param xs: x coordinates;
+    :param ys: values;
+    :param number_of_points: number of points to select.
+    :return: indices of selected points.
+    """
+
+    if len(xs) <= number_of_points or number_of_points < 3:
+        return np.arange(len(xs))
+    bounds = _get_bucket_bounds(len(xs) - 2, number_of_points - 2) + 1
+    bounds[-1] = len(xs) - 1
+    x_averages = np.add.reduceat(xs[1:-1], bounds[:-1] - 1) / np.diff(bounds)
+    y_averages = np.add.reduceat(ys[1:-1], bounds[:-1] - 1) / np.diff(bounds)
+    x_averages = np.append(x_averages[1:], xs[-1])
+    y_averages = np.append(y_averages[1:], ys[-1])
+    indices = np.empty(number_of_points, dtype=int)
+    indices[0], indices[-1] = 0, len(xs) - 1
+    index = 0
+    for bucket in range(number_of_points - 2):
+        start, stop = bounds[bucket], bounds[bucket + 1]
+        areas = np.abs((xs[index] - x_averages[bucket]) * (ys[start:stop] - ys[index]) -
+                       (xs[index] - xs[start:stop]) * (y_averages[bucket] - ys[index]))
+        index = start + int(np.argmax(areas))
+        indices[bucket + 1] = index
+    return indices
+
+
+def select_by_min_max(xs: np.ndarray, ys: np.ndarray, number_of_points: int) -> np.ndarray:
+    """
+    Function selects points with min and max values in every bucket of points,
+    so that envelope of values is kept. Non-finite values are ignored.
+    :param xs: x coordinates;
+    :param ys: values;
+    :param number_of_points: number of points to select.
+    :return: indices of selected points.
+    """
+
+    number_of_buckets = max(1, number_of_points // 2 - 1)
+    if len(xs) <= number_of_points:
+        return np.arange(len(xs))
+    bucket_size = -(-len(ys) // number_of_buckets)
+    padded = np.full(bucket_size * number_of_buckets, np.nan)
+    padded[:len(ys)] = np.where(np.isfinite(ys), ys, np.nan)
+    buckets = padded.reshape(number_of_buckets, bucket_size)
+    finite = ~np.all(np.isnan(buckets), axis=1)
+    starts = np.arange(number_of_buckets)[finite] * bucket_size
+    minimums = starts + np.nanargmin(buckets[finite], axis=1)
+    maximums = starts + np.nanargmax(buckets[finite], axis=1)
+    return np.unique(np.concatenate(([0], minimums, maximums, [len(xs) - 1])))
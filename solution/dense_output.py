@@ -0,0 +1,61 @@
+"""
+File with class to evaluate solution of differential equation between points
+of integration.
+"""
+
+from typing import List
+import numpy as np
+from solution.companion import create_companion_matrix, create_free_vector
+
+
+class DenseOutput:
+    """
+    Class for continuous extension of solution by cubic Hermite interpolation.
+    Derivatives of variables in points of solution are calculated exactly as
+    A y + b, so interpolation has error of order h^4 at integration step h and
+    does not spoil accuracy of fourth order methods.
+    """
+
+    def __init__(self, xs: np.ndarray, ys: np.ndarray, coefficients: List[float], free_argument: float):
+        """
+        :param xs: x coordinates of solution in increasing order;
+        :param ys: array with values of y and its derivatives in rows;
+        :param coefficients: coefficients of equation;
+        :param free_argument: free argument of equation.
+        """
+
+        self._free_vector: np.ndarray = create_free_vector(len(coefficients) - 1, free_argument)
+        self._matrix: np.ndarray = create_companion_matrix(coefficients)
+        self._xs: np.ndarray = np.asarray(xs)
+        self._ys: np.ndarray = np.asarray(ys)
+
+    @property
+    def limits(self) -> tuple:
+        """
+        :return: segment in which solution can be evaluated.
+        """
+
+        return self._xs[0], self._xs[-1]
+
+    def evaluate(self, grid: np.ndarray) -> np.ndarray:
+        """
+        Method evaluates solution in given x coordinates.
+        :param grid: x coordinates inside segment of solution.
+        :return: array with values of y and its derivatives in rows.
+        """
+
+        grid = np.asarray(grid, dtype=float)
+        if len(self._xs) < 2:
+            return np.repeat(self._ys[:1], len(grid), axis=0)
+        min_x, max_x = self.limits
+        if len(grid) and (grid.min() < min_x or grid.max() > max_x):
+            raise ValueError(f"Solution can be evaluated only in segment [{min_x}, {max_x}]")
+        indices = np.clip(np.searchsorted(self._xs, grid, side="right") - 1, 0, len(self._xs) - 2)
+        x_0, x_1 = self._xs[indices], self._xs[indices + 1]
+        y_0, y_1 = self._ys[indices], self._ys[indices + 1]
+        steps = (x_1 - x_0)[:, np.newaxis]
+        t = ((grid - x_0) / (x_1 - x_0))[:, np.newaxis]
+        f_0 = y_0 @ self._matrix.T + self._free_vector
+        f_1 = y_1 @ self._matrix.T + self._free_vector
+        return ((1 + 2 * t) * (1 - t) ** 2 * y_0 + t * (1 - t) ** 2 * steps * f_0 + t ** 2 * (3 - 2 * t) * y_1 +
+                t ** 2 * (t - 1) * steps * f_1)
@@ -0,0 +1,187 @@
+"""
+File with solver to solve differential equation by adaptive Dormand-Prince
+method.
+"""
+
+from typing import List, Tuple
+import numpy as np
+from solution.vectorized_runge_kutta import VectorizedRungeKutta
+
+
+class DormandPrince(VectorizedRungeKutta):
+    """
+    Class to solve differential equation by embedded Runge-Kutta method of
+    Dormand and Prince of order 5(4). Step is chosen on every step from local
+    error estimate. Local error does not bound global error, so accuracy of
+    solution is estimated by comparison with pass with tolerance decreased by
+    TOLERANCE_DECREASE times, which goes through all points of first pass.
+    """
+
+    A: np.ndarray = np.array([[0, 0, 0, 0, 0, 0],
+                              [1 / 5, 0, 0, 0, 0, 0],
+                              [3 / 40, 9 / 40, 0, 0, 0, 0],
+                              [44 / 45, -56 / 15, 32 / 9, 0, 0, 0],
+                              [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729, 0, 0],
+                              [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656, 0],
+                              [35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84]])
+    ERROR_WEIGHTS: np.ndarray = np.array([71 / 57600, 0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525,
+                                          -1 / 40])
+    MAX_FACTOR: float = 5
+    MIN_FACTOR: float = 0.2
+    SAFETY_FACTOR: float = 0.9
+    EVALUATIONS_PER_STEP: int = 6
+    FIXED_STEP: bool = False
+    TOLERANCE_DECREASE: float = 10
+
+    def __init__(self):
+        super().__init__()
+        self._absolute_tolerance: float = None
+        self._accepted_steps: int = 0
+        self._rejected_steps: int = 0
+        self._relative_tolerance: float = None
+        self._xs: np.ndarray = None
+
+    @property
+    def accepted_steps(self) -> int:
+        """
+        :return: number of accepted steps in last iteration.
+        """
+
+        return self._accepted_steps
+
+    @property
+    def rejected_steps(self) -> int:
+        """
+        :return: number of rejected steps in last iteration.
+        """
+
+        return self._rejected_steps
+
+    def _calculate_error_norm(self, error: np.ndarray, variables: np.ndarray, new_variables: np.ndarray) -> float:
+        """
+        Method calculates norm of local error relative to tolerance.
+        :param error: local error estimate;
+        :param variables: solution at start of step;
+        :param new_variables: solution at end of step.
+        :return: norm of error, step is accepted if norm is not greater than 1.
+        """
+
+        scale = self._absolute_tolerance + self._relative_tolerance * np.maximum(np.abs(variables),
+                                                                                np.abs(new_variables))
+        return float(np.sqrt(np.mean((error / scale) ** 2)))
+
+    def _get_initial_step(self, variables: np.ndarray, derivatives: np.ndarray) -> float:
+        """
+        Method chooses initial step from norms of solution and its derivatives.
+        :param variables: solution at start of segment;
+        :param derivatives: derivatives of solution at start of segment.
+        :return: initial step.
+        """
+
+        scale = self._absolute_tolerance + self._relative_tolerance * np.abs(variables)
+        norm_of_variables = np.sqrt(np.mean((variables / scale) ** 2))
+        norm_of_derivatives = np.sqrt(np.mean((derivatives / scale) ** 2))
+        if norm_of_variables < 1e-5 or norm_of_derivatives < 1e-5:
+            step = 1e-6
+        else:
+            step = 0.01 * norm_of_variables / norm_of_derivatives
+        new_derivatives = self._matrix.dot(variables + step * derivatives) + self._free_vector
+        self._number_of_evaluations += 1
+        norm_of_second_derivatives = np.sqrt(np.mean(((new_derivatives - derivatives) / scale) ** 2)) / step
+        max_norm = max(norm_of_derivatives, norm_of_second_derivatives)
+        if max_norm <= 1e-15:
+            new_step = max(1e-6, step * 1e-3)
+        else:
+            new_step = (0.01 / max_norm) ** (1 / 5)
+        return min(100 * step, new_step, self._max_x - self._min_x)
+
+    def _solve_for_step(self, step: float, stops: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Method solves equation with adaptive step.
+        :param step: initial step;
+        :param stops: x coordinates in increasing order through which solution
+        has to go, the last one is end of segment.
+        :return: solution.
+        """
+
+        x = self._min_x
+        variables = np.array(self._borders, dtype=float)
+        xs: List[float] = [x]
+        trajectory: List[np.ndarray] = [variables]
+        stages = np.empty((len(self.A), self._equation_order))
+        stages[0] = self._matrix.dot(variables) + self._free_vector
+        self._number_of_evaluations += 1
+        stops = [self._max_x] if stops is None else stops
+        stop_index = 0
+        length = self._max_x - self._min_x
+        self._progress.start(length)
+        while x < self._max_x:
+            step = min(step, stops[stop_index] - x)
+            for index in range(1, len(self.A)):
+                variables_for_stage = variables + step * self.A[index, :index].dot(stages[:index])
+                stages[index] = self._matrix.dot(variables_for_stage) + self._free_vector
+            new_variables = variables_for_stage
+            error = step * self.ERROR_WEIGHTS.dot(stages)
+            error_norm = self._calculate_error_norm(error, variables, new_variables)
+            self._count_steps(1)
+            if error_norm <= 1:
+                self._accepted_steps += 1
+                if stops[stop_index] - x - step <= 1e-12 * length:
+                    x = stops[stop_index]
+                    stop_index += 1
+                else:
+                    x += step
+                variables = new_variables
+                xs.append(x)
+                trajectory.append(variables)
+                stages[0] = stages[-1]
+                self._progress.update(x - self._min_x, len(xs) - 1)
+            else:
+                self._rejected_steps += 1
+            factor = self.MAX_FACTOR if error_norm == 0 else self.SAFETY_FACTOR * error_norm ** (-1 / 5)
+            step *= min(self.MAX_FACTOR, max(self.MIN_FACTOR, factor))
+        return np.array(xs), np.array(trajectory)
+
+    def set_accuracy(self, accuracy: float):
+        """
+        Method sets required accuracy of solution.
+        :param accuracy: required accuracy.
+        """
+
+        super().set_accuracy(accuracy)
+        self._absolute_tolerance = accuracy
+        self._relative_tolerance = accuracy
+
+    def solve(self) -> Tuple[int, float, np.ndarray, np.ndarray]:
+        """
+        Method solves equation in two passes with adaptive step, the second
+        pass has smaller tolerance and goes through points of the first one.
+        Accuracy is estimated as difference between passes, solution of the
+        second pass is returned. If estimated accuracy is worse than required
+        then next call takes solution of the second pass as the first pass and
+        decreases tolerance again.
+        :return: iteration number, estimated accuracy of calculation and
+        solution.
+        """
+
+        self._iteration_number += 1
+        self._accepted_steps = 0
+        self._rejected_steps = 0
+        borders = np.array(self._borders, dtype=float)
+        derivatives = self._matrix.dot(borders) + self._free_vector
+        self._number_of_evaluations += 1
+        if self._iteration_number > 1:
+            xs, variables = self._xs, self._variables
+        else:
+            step = self._get_initial_step(borders, derivatives)
+            self._calculation_for_step_started(self._iteration_number, step)
+            xs, variables = self._solve_for_step(step)
+        self._absolute_tolerance /= self.TOLERANCE_DECREASE
+        self._relative_tolerance /= self.TOLERANCE_DECREASE
+        step = self._get_initial_step(borders, derivatives)
+        if self._iteration_number > 1:
+            self._calculation_for_step_started(self._iteration_number, step)
+        self._xs, self._variables = self._solve_for_step(step, xs[1:])
+        indices = np.searchsorted(self._xs, xs)
+        accuracy = float(np.abs(self._variables[indices, 0] - variables[:, 0]).max())
+        return self._iteration_number, accuracy, self._xs, self._variables
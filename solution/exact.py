@@ -0,0 +1,252 @@
+"""
+File with exact solution of linear differential equation with constant
+coefficients.
+"""
+
+import math
+from typing import Callable, List, Optional, Tuple
+import numpy as np
+from solution.companion import create_companion_matrix, create_free_vector
+from solution.progress import Progress
+from solution.runge_kutta import RungeKutta
+
+
+class ExactSolution:
+    """
+    Class for exact solution of differential equation. Solution is written
+    through roots of characteristic polynomial, repeated roots give terms
+    x^j * exp(root * x). If repeated roots can not be separated from close
+    distinct roots or constants of solution are ill-conditioned, solution is
+    calculated as exponential of matrix of system y' = A y + b. Class can be
+    used as reference to check numerical solutions.
+    """
+
+    MAX_CONDITION_NUMBER: float = 1e8
+    MAX_TAYLOR_NORM: float = 0.5
+    RESIDUAL_TOLERANCE: float = 1e-8
+    ROOT_TOLERANCE: float = 10
+    TAYLOR_ORDER: int = 18
+
+    def __init__(self, coefficients: List[float], free_argument: float, borders: List[float], min_x: float):
+        """
+        :param coefficients: coefficients of equation;
+        :param free_argument: free argument of equation;
+        :param borders: values of border equations;
+        :param min_x: point in which border equations are given.
+        """
+
+        self._equation_order: int = len(coefficients) - 1
+        self._min_x: float = min_x
+        self._system_matrix: Optional[np.ndarray] = None
+        self._system_vector: np.ndarray = np.append(np.asarray(borders, dtype=float), 1)
+        # Equation is solved in the same form as in RungeKutta solver:
+        # y^(n) + sum(coefficients[i] / coefficients[n] * y^(i)) = free_argument
+        polynomial = np.asarray(coefficients, dtype=float) / coefficients[-1]
+        self._particular_coefficient, self._particular_power = self._get_particular_solution(polynomial,
+                                                                                             free_argument)
+        self._roots: Optional[List[Tuple[complex, int]]] = self._get_roots(polynomial)
+        particular_borders = self._calculate_particular_solution(np.zeros(1))[:, 0]
+        self._constants: Optional[List[np.ndarray]] = None
+        if self._roots is not None:
+            self._constants = self._get_constants(np.asarray(borders, dtype=float) - particular_borders)
+        if self._constants is None:
+            self._system_matrix = self._create_system_matrix(coefficients, free_argument)
+
+    def _calculate_by_exponential(self, ts: np.ndarray) -> np.ndarray:
+        """
+        Method calculates solution as exp(G t) (y_0, 1), where G is matrix of
+        system. Exponential is found by scaling and squaring: matrix G t is
+        divided by power of 2 so that its norm is not greater than
+        MAX_TAYLOR_NORM, exponential of divided matrix is sum of Taylor series,
+        and then it is squared back.
+        :param ts: distances from point with border equations.
+        :return: array with solution in rows and derivatives in columns.
+        """
+
+        matrices = ts[:, np.newaxis, np.newaxis] * self._system_matrix
+        norms = np.abs(matrices).sum(axis=1).max(axis=1)
+        squarings = np.ceil(np.log2(np.maximum(norms, self.MAX_TAYLOR_NORM) / self.MAX_TAYLOR_NORM)).astype(int)
+        matrices /= 2.0 ** squarings[:, np.newaxis, np.newaxis]
+        exponentials = np.broadcast_to(np.eye(len(self._system_vector)), matrices.shape).copy()
+        term = exponentials.copy()
+        for power in range(1, self.TAYLOR_ORDER + 1):
+            term = term @ matrices / power
+            exponentials += term
+        for squaring in range(squarings.max(initial=0)):
+            indices = squarings > squaring
+            exponentials[indices] = exponentials[indices] @ exponentials[indices]
+        return exponentials[:, :-1].dot(self._system_vector)
+
+    def _calculate_particular_solution(self, ts: np.ndarray) -> np.ndarray:
+        """
+        Method calculates particular solution and its derivatives.
+        :param ts: distances from point with border equations.
+        :return: array with derivatives of particular solution in rows.
+        """
+
+        variables = np.zeros((self._equation_order, len(ts)))
+        power = self._particular_power
+        for index in range(min(power + 1, self._equation_order)):
+            coefficient = self._particular_coefficient * math.factorial(power) / math.factorial(power - index)
+            variables[index] = coefficient * ts ** (power - index)
+        return variables
+
+    @staticmethod
+    def _create_system_matrix(coefficients: List[float], free_argument: float) -> np.ndarray:
+        """
+        Method creates matrix G = [[A, b], [0, 0]] of system y' = A y + b
+        written for vector (y, 1).
+        :param coefficients: coefficients of equation;
+        :param free_argument: free argument of equation.
+        :return: matrix G.
+        """
+
+        equation_order = len(coefficients) - 1
+        matrix = np.zeros((equation_order + 1, equation_order + 1))
+        matrix[:-1, :-1] = create_companion_matrix(coefficients)
+        matrix[:-1, -1] = create_free_vector(equation_order, free_argument)
+        return matrix
+
+    def _get_constants(self, borders: np.ndarray) -> Optional[List[np.ndarray]]:
+        """
+        Method calculates constants of general solution from border equations.
+        :param borders: values of border equations for homogeneous equation.
+        :return: list with coefficients of polynomials for every root or None
+        if system for constants is ill-conditioned.
+        """
+
+        matrix = np.concatenate([self._get_derivative_matrix(root, multiplicity) *
+                                 [math.factorial(power) for power in range(multiplicity)]
+                                 for root, multiplicity in self._roots], axis=1)
+        if np.linalg.cond(matrix) > self.MAX_CONDITION_NUMBER:
+            return None
+        constants = np.linalg.solve(matrix, borders.astype(complex))
+        indices = np.cumsum([multiplicity for _, multiplicity in self._roots])[:-1]
+        return np.split(constants, indices)
+
+    def _get_derivative_matrix(self, root: complex, multiplicity: int) -> np.ndarray:
+        """
+        Method returns matrix W with W[k, i] = C(k, i) * root^(k - i). Derivative
+        of order k of function q(x) * exp(root * x) is equal to
+        exp(root * x) * sum(W[k, i] * q^(i)(x)).
+        :param root: root of characteristic polynomial;
+        :param multiplicity: multiplicity of root.
+        :return: matrix W.
+        """
+
+        matrix = np.zeros((self._equation_order, multiplicity), dtype=complex)
+        for order in range(self._equation_order):
+            for index in range(min(order + 1, multiplicity)):
+                binomial = math.factorial(order) // (math.factorial(index) * math.factorial(order - index))
+                matrix[order, index] = binomial * root ** (order - index)
+        return matrix
+
+    @staticmethod
+    def _get_particular_solution(polynomial: np.ndarray, free_argument: float) -> Tuple[float, int]:
+        """
+        Method finds particular solution of form c * x^s, where s is index of
+        lowest non-zero coefficient of equation.
+        :param polynomial: normalized coefficients of equation;
+        :param free_argument: free argument of equation.
+        :return: coefficient c and power s.
+        """
+
+        power = int(np.flatnonzero(polynomial)[0])
+        return free_argument / (polynomial[power] * math.factorial(power)), power
+
+    def _get_roots(self, polynomial: np.ndarray) -> Optional[List[Tuple[complex, int]]]:
+        """
+        Method finds roots of characteristic polynomial and their multiplicities.
+        Numerical method splits root of multiplicity m into m roots at distance
+        of order eps^(1/m) from it. So every cluster is grown from root by its
+        nearest roots, and the largest cluster whose roots are within
+        ROOT_TOLERANCE * eps^(1/m) of their mean is replaced by the mean.
+        Clustering is accepted only if polynomial with found roots is equal to
+        characteristic polynomial within RESIDUAL_TOLERANCE, otherwise close
+        distinct roots were merged.
+        :param polynomial: normalized coefficients of equation.
+        :return: list with roots and their multiplicities or None if roots can
+        not be found reliably.
+        """
+
+        roots = sorted(np.roots(polynomial[::-1]), key=lambda value: (value.real, value.imag))
+        eps = np.finfo(float).eps
+        result = []
+        while roots:
+            neighbours = sorted(roots, key=lambda value: abs(value - roots[0]))
+            cluster = neighbours[:1]
+            for size in range(len(neighbours), 1, -1):
+                mean = np.mean(neighbours[:size])
+                spread = max(abs(value - mean) for value in neighbours[:size])
+                if spread <= self.ROOT_TOLERANCE * eps ** (1 / size) * max(1, abs(mean)):
+                    cluster = neighbours[:size]
+                    break
+            result.append((complex(np.mean(cluster)), len(cluster)))
+            roots = [value for value in roots if all(value is not member for member in cluster)]
+        clustered_polynomial = np.poly([root for root, multiplicity in result for _ in range(multiplicity)])
+        residual = np.abs(clustered_polynomial[::-1] - polynomial).max() / np.abs(polynomial).max()
+        return result if residual <= self.RESIDUAL_TOLERANCE else None
+
+    def calculate(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Method calculates solution and its derivatives in given points. Cost of
+        calculation is O(n^2) for every point, where n is order of equation,
+        or O(n^3) if solution is calculated through exponential of matrix.
+        :param xs: x coordinates.
+        :return: array with solution in rows and derivatives in columns.
+        """
+
+        ts = np.asarray(xs, dtype=float) - self._min_x
+        if self._system_matrix is not None:
+            return self._calculate_by_exponential(ts)
+        variables = self._calculate_particular_solution(ts).astype(complex)
+        for (root, multiplicity), constants in zip(self._roots, self._constants):
+            polynomial = np.polynomial.Polynomial(constants)
+            derivatives = np.array([polynomial.deriv(order)(ts) for order in range(multiplicity)])
+            variables += self._get_derivative_matrix(root, multiplicity).dot(derivatives) * np.exp(root * ts)
+        return variables.real.T
+
+
+class ExactSolver(RungeKutta):
+    """
+    Class to find exact solution of differential equation in points of
+    segment. Solution is found in one iteration without integration.
+    """
+
+    NUMBER_OF_POINTS: int = 501
+    FIXED_STEP: bool = False
+
+    def __init__(self):
+        super().__init__()
+        self._solution: ExactSolution = None
+
+    def set_data(self, coefficients: List[float], free_argument: float, borders: List[float], limits: Tuple[int],
+                 progress: Progress = None,
+                 calculation_for_step_started: Callable[[int, float], None] = None):
+        """
+        Method sets new params for equation to solve.
+        :param coefficients: coefficients of equation;
+        :param free_argument: free argument of equation;
+        :param borders: values of border equations;
+        :param limits: segment in which to find solution;
+        :param progress: object to report progress of integration and to stop
+        it;
+        :param calculation_for_step_started: function to call when integration
+        of equation with given step was started.
+        """
+
+        super().set_data(coefficients, free_argument, borders, limits, progress,
+                         calculation_for_step_started)
+        self._solution = ExactSolution(coefficients, free_argument, borders, self._min_x)
+
+    def solve(self) -> Tuple[int, float, np.ndarray, np.ndarray]:
+        """
+        Method finds exact solution of equation.
+        :return: iteration number, accuracy of calculation and solution.
+        """
+
+        self._iteration_number += 1
+        xs = np.linspace(self._min_x, self._max_x, self.NUMBER_OF_POINTS)
+        self._calculation_for_step_started(self._iteration_number, xs[1] - xs[0])
+        variables = self._solution.calculate(xs)
+        return self._iteration_number, 0.0, xs, variables
@@ -0,0 +1,167 @@
+"""
+File with functions to save solution of differential equation to files. Large
+solutions are written by chunks, so that memory used by export does not depend
+on number of points. Export reports its progress and can be stopped through
+Progress object.
+"""
+
+import os
+from typing import Iterator, Tuple
+import numpy as np
+from solution.progress import Progress
+
+CHUNK_SIZE: int = 4096
+MAX_NUMBER_OF_EXCEL_ROWS: int = 1048576
+
+
+def _create_header(number_of_columns: int) -> Tuple[str, ...]:
+    """
+    Function creates names of columns of solution.
+    :param number_of_columns: number of values of y and its derivatives.
+    :return: names of columns.
+    """
+
+    return ("x",) + tuple(f"y{index}" for index in range(number_of_columns))
+
+
+def _iterate_chunks(xs: np.ndarray, ys: np.ndarray, chunk_size: int) -> Iterator[np.ndarray]:
+    """
+    Function splits solution into chunks of rows with x coordinate in first
+    column.
+    :param xs: x coordinates;
+    :param ys: values of y and its derivatives;
+    :param chunk_size: number of rows in chunk.
+    :return: chunks of solution.
+    """
+
+    for start in range(0, len(xs), chunk_size):
+        yield np.column_stack((xs[start:start + chunk_size], ys[start:start + chunk_size]))
+
+
+def save_to_excel(file_name: str, xs: np.ndarray, ys: np.ndarray, chunk_size: int = CHUNK_SIZE,
+                  progress: Progress = None):
+    """
+    Function saves solution to xlsx file in constant memory mode of xlsxwriter,
+    so that rows are flushed to disk as soon as they are written. If solution
+    does not fit into one worksheet then it is continued in next worksheets.
+    :param file_name: name of file;
+    :param xs: x coordinates;
+    :param ys: values of y and its derivatives;
+    :param chunk_size: number of rows converted at once;
+    :param progress: object to report progress of export and to stop it.
+    """
+
+    import xlsxwriter
+
+    progress = progress or Progress()
+    check_interval = progress.start(len(xs))
+    header = _create_header(ys.shape[1])
+    number_of_rows = 0
+    with xlsxwriter.Workbook(file_name, {"constant_memory": True, "nan_inf_to_errors": True}) as workbook:
+        worksheet = None
+        row_index = MAX_NUMBER_OF_EXCEL_ROWS
+        for chunk in _iterate_chunks(xs, ys, chunk_size):
+            for row in chunk.tolist():
+                if row_index == MAX_NUMBER_OF_EXCEL_ROWS:
+                    worksheet = workbook.add_worksheet()
+                    worksheet.write_row(0, 0, header)
+                    row_index = 1
+                worksheet.write_row(row_index, 0, row)
+                row_index += 1
+                number_of_rows += 1
+                if number_of_rows % check_interval == 0:
+                    progress.update(number_of_rows)
+
+
+def save_to_npy(file_name: str, xs: np.ndarray, ys: np.ndarray, chunk_size: int = CHUNK_SIZE,
+                progress: Progress = None):
+    """
+    Function saves solution to npy file as one array with x coordinates in
+    first column. Array in file is filled by chunks through memory map.
+    :param file_name: name of file;
+    :param xs: x coordinates;
+    :param ys: values of y and its derivatives;
+    :param chunk_size: number of rows copied at once;
+    :param progress: object to report progress of export and to stop it.
+    """
+
+    progress = progress or Progress()
+    progress.start(len(xs))
+    array = np.lib.format.open_memmap(file_name, mode="w+", dtype=float, shape=(len(xs), ys.shape[1] + 1))
+    for start, chunk in zip(range(0, len(xs), chunk_size), _iterate_chunks(xs, ys, chunk_size)):
+        array[start:start + len(chunk)] = chunk
+        progress.update(start + len(chunk))
+    array.flush()
+    del array
+
+
+def save_to_npz(file_name: str, xs: np.ndarray, ys: np.ndarray, progress: Progress = None):
+    """
+    Function saves solution to npz file with arrays xs and ys. NumPy writes
+    arrays to archive by buffered chunks, so progress is reported only after
+    archive was written.
+    :param file_name: name of file;
+    :param xs: x coordinates;
+    :param ys: values of y and its derivatives;
+    :param progress: object to report progress of export and to stop it.
+    """
+
+    progress = progress or Progress()
+    progress.start(len(xs))
+    progress.update(0)
+    np.savez(file_name, xs=xs, ys=ys)
+    progress.update(len(xs))
+
+
+def save_to_text(file_name: str, xs: np.ndarray, ys: np.ndarray, delimiter: str = "  ", header: bool = False,
+                 x_format: str = "%.5f", chunk_size: int = CHUNK_SIZE, progress: Progress = None):
+    """
+    Function saves solution to text file. Every chunk of rows is formatted by
+    one formatting operation. Values of y and its derivatives are written
+    exactly.
+    :param file_name: name of file;
+    :param xs: x coordinates;
+    :param ys: values of y and its derivatives;
+    :param delimiter: delimiter of values in row;
+    :param header: if True then names of columns are written in first row;
+    :param x_format: format of x coordinates;
+    :param chunk_size: number of rows formatted at once;
+    :param progress: object to report progress of export and to stop it.
+    """
+
+    progress = progress or Progress()
+    progress.start(len(xs))
+    row_format = delimiter.join([x_format] + ["%r"] * ys.shape[1]) + "\n"
+    with open(file_name, "w", encoding="utf-8") as file:
+        if header:
+            file.write(delimiter.join(_create_header(ys.shape[1])) + "\n")
+        for start, chunk in zip(range(0, len(xs), chunk_size), _iterate_chunks(xs, ys, chunk_size)):
+            file.write((row_format * len(chunk)) % tuple(chunk.ravel().tolist()))
+            progress.update(start + len(chunk))
+
+
+def save_solution(file_name: str, xs: np.ndarray, ys: np.ndarray, progress: Progress = None):
+    """
+    Function saves solution to file in format given by extension of file:
+    xlsx, csv, npy, npz or text file for other extensions. If export was
+    stopped through progress object then CalculationStopped is raised and file
+    is left incomplete.
+    :param file_name: name of file;
+    :param xs: x coordinates;
+    :param ys: values of y and its derivatives;
+    :param progress: object to report progress of export and to stop it.
+    """
+
+    xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+    ys = ys.reshape(len(xs), -1)
+    extension = os.path.splitext(file_name)[-1].lower()
+    if extension == ".xlsx":
+        save_to_excel(file_name, xs, ys, progress=progress)
+    elif extension == ".csv":
+        save_to_text(file_name, xs, ys, delimiter=",", header=True, x_format="%r", progress=progress)
+    elif extension == ".npy":
+        save_to_npy(file_name, xs, ys, progress=progress)
+    elif extension == ".npz":
+        save_to_npz(file_name, xs, ys, progress=progress)
+    else:
+        save_to_text(file_name, xs, ys, progress=progress)
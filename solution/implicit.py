@@ -0,0 +1,187 @@
+"""
+File with solvers to solve stiff differential equation by implicit methods.
+"""
+
+from typing import Callable, List, Tuple
+import numpy as np
+from solution.companion import create_grid
+from solution.progress import Progress
+from solution.trajectory import create_trajectory
+from solution.vectorized_runge_kutta import VectorizedRungeKutta
+
+
+class Rosenbrock(VectorizedRungeKutta):
+    """
+    Class to solve differential equation by L-stable Rosenbrock method of
+    fourth order with parameters of Hairer and Wanner. Jacobian of system
+    y' = A y + b is constant companion matrix A, so matrix I / (gamma h) - A
+    is inverted once for step and used on every stage of every step.
+    """
+
+    A21: float = 2
+    A31: float = 1.867943637803922
+    A32: float = 0.2344449711399156
+    B: np.ndarray = np.array([2.255570073418735, 0.2870493262186792, 0.4353179431840180, 1.093502252409163])
+    C21: float = -7.137615036412310
+    C31: float = 2.580708087951457
+    C32: float = 0.6515950076447975
+    C41: float = -2.137148994382534
+    C42: float = -0.3214669691237626
+    C43: float = -0.6949742501781779
+    EVALUATIONS_PER_STEP: int = 3
+    GAMMA: float = 0.57282
+
+    def __init__(self):
+        super().__init__()
+        self._inverse_matrix: np.ndarray = None
+        self._inverse_matrix_step: float = None
+
+    def _calculate_rosenbrock_step(self, variables: np.ndarray, step: float) -> np.ndarray:
+        """
+        Method makes one step of Rosenbrock method.
+        :param variables: solution at start of step;
+        :param step: step.
+        :return: solution at end of step.
+        """
+
+        inverse_matrix = self._get_inverse_matrix(step, self.GAMMA)
+        g_1 = inverse_matrix.dot(self._matrix.dot(variables) + self._free_vector)
+        f_2 = self._matrix.dot(variables + self.A21 * g_1) + self._free_vector
+        g_2 = inverse_matrix.dot(f_2 + self.C21 * g_1 / step)
+        f_3 = self._matrix.dot(variables + self.A31 * g_1 + self.A32 * g_2) + self._free_vector
+        g_3 = inverse_matrix.dot(f_3 + (self.C31 * g_1 + self.C32 * g_2) / step)
+        g_4 = inverse_matrix.dot(f_3 + (self.C41 * g_1 + self.C42 * g_2 + self.C43 * g_3) / step)
+        return variables + self.B.dot((g_1, g_2, g_3, g_4))
+
+    def _get_inverse_matrix(self, step: float, gamma: float) -> np.ndarray:
+        """
+        Method returns inverse of matrix I / (gamma h) - A. Matrix is inverted
+        once for every step.
+        :param step: step;
+        :param gamma: parameter of method.
+        :return: inverse matrix.
+        """
+
+        if self._inverse_matrix is None or self._inverse_matrix_step != step:
+            matrix = np.eye(self._equation_order) / (gamma * step) - self._matrix
+            self._inverse_matrix = np.linalg.inv(matrix)
+            self._inverse_matrix_step = step
+        return self._inverse_matrix
+
+    def _solve_for_step(self, step: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Method solves equation for given step.
+        :param step: step.
+        :return: solution.
+        """
+
+        xs = create_grid(self._min_x, self._max_x, step)
+        variables = create_trajectory(len(xs), self._equation_order)
+        variables[0] = self._borders
+        number_of_segments = len(xs) - 1
+        check_interval = self._progress.start(number_of_segments, xs, variables)
+        for index in range(number_of_segments):
+            variables[index + 1] = self._calculate_rosenbrock_step(variables[index], step)
+            if index % check_interval == 0:
+                self._progress.update(index + 1)
+        self._count_steps(number_of_segments)
+        return xs, variables
+
+    def set_data(self, coefficients: List[float], free_argument: float, borders: List[float], limits: Tuple[int],
+                 progress: Progress = None,
+                 calculation_for_step_started: Callable[[int, float], None] = None):
+        """
+        Method sets new params for equation to solve.
+        :param coefficients: coefficients of equation;
+        :param free_argument: free argument of equation;
+        :param borders: values of border equations;
+        :param limits: segment in which to find solution;
+        :param progress: object to report progress of integration and to stop
+        it;
+        :param calculation_for_step_started: function to call when integration
+        of equation with given step was started.
+        """
+
+        super().set_data(coefficients, free_argument, borders, limits, progress,
+                         calculation_for_step_started)
+        self._inverse_matrix = None
+        self._inverse_matrix_step = None
+
+
+class BackwardDifferentiation(Rosenbrock):
+    """
+    Class to solve differential equation by backward differentiation formula of
+    fourth order. Every step needs solution of linear system with constant
+    matrix (25 / 12) I - h A, which is inverted once for step. First steps are
+    made by Rosenbrock method.
+    """
+
+    ALPHAS: np.ndarray = np.array([-1 / 4, 4 / 3, -3, 4])
+    BETA: float = 12 / 25
+    EVALUATIONS_PER_STEP: int = 1
+
+    def __init__(self):
+        super().__init__()
+        self._bdf_inverse_matrix: np.ndarray = None
+        self._bdf_inverse_matrix_step: float = None
+
+    def _get_bdf_inverse_matrix(self, step: float) -> np.ndarray:
+        """
+        Method returns inverse of matrix I / (beta h) - A. Matrix is inverted
+        once for every step.
+        :param step: step.
+        :return: inverse matrix.
+        """
+
+        if self._bdf_inverse_matrix is None or self._bdf_inverse_matrix_step != step:
+            matrix = np.eye(self._equation_order) / (self.BETA * step) - self._matrix
+            self._bdf_inverse_matrix = np.linalg.inv(matrix)
+            self._bdf_inverse_matrix_step = step
+        return self._bdf_inverse_matrix
+
+    def _solve_for_step(self, step: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Method solves equation for given step.
+        :param step: step.
+        :return: solution.
+        """
+
+        xs = create_grid(self._min_x, self._max_x, step)
+        variables = create_trajectory(len(xs), self._equation_order)
+        variables[0] = self._borders
+        number_of_start_steps = len(self.ALPHAS) - 1
+        inverse_matrix = self._get_bdf_inverse_matrix(step)
+        number_of_segments = len(xs) - 1
+        check_interval = self._progress.start(number_of_segments, xs, variables)
+        for index in range(number_of_segments):
+            if index < number_of_start_steps:
+                variables[index + 1] = self._calculate_rosenbrock_step(variables[index], step)
+            else:
+                history = self.ALPHAS.dot(variables[index - number_of_start_steps:index + 1])
+                variables[index + 1] = inverse_matrix.dot(history / step + self._free_vector)
+            if index % check_interval == 0:
+                self._progress.update(index + 1)
+        number_of_start_steps = min(number_of_start_steps, number_of_segments)
+        self._count_steps(number_of_start_steps, Rosenbrock.EVALUATIONS_PER_STEP)
+        self._count_steps(number_of_segments - number_of_start_steps)
+        return xs, variables
+
+    def set_data(self, coefficients: List[float], free_argument: float, borders: List[float], limits: Tuple[int],
+                 progress: Progress = None,
+                 calculation_for_step_started: Callable[[int, float], None] = None):
+        """
+        Method sets new params for equation to solve.
+        :param coefficients: coefficients of equation;
+        :param free_argument: free argument of equation;
+        :param borders: values of border equations;
+        :param limits: segment in which to find solution;
+        :param progress: object to report progress of integration and to stop
+        it;
+        :param calculation_for_step_started: function to call when integration
+        of equation with given step was started.
+        """
+
+        super().set_data(coefficients, free_argument, borders, limits, progress,
+                         calculation_for_step_started)
+        self._bdf_inverse_matrix = None
+        self._bdf_inverse_matrix_step = None
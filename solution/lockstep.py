@@ -0,0 +1,68 @@
+"""
+File with solver to solve differential equation by Runge-Kutta method with
+simultaneous integration for step and double step.
+"""
+
+from typing import Tuple
+import numpy as np
+from solution.companion import create_grid
+from solution.trajectory import create_trajectory
+from solution.vectorized_runge_kutta import VectorizedRungeKutta
+
+
+class LockstepRungeKutta(VectorizedRungeKutta):
+    """
+    Class to solve differential equation by Runge-Kutta method. Solutions for
+    step and double step are integrated together and accuracy is estimated by
+    Runge rule after every double step. Iteration is stopped as soon as
+    required accuracy is exceeded, and only solution for step is stored.
+    """
+
+    def _solve_in_lockstep(self, step: float) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        Method solves equation for given step and double step.
+        :param step: step.
+        :return: x coordinates, solution for step and accuracy of solution.
+        If accuracy was exceeded then solution up to point where it happened is
+        returned.
+        """
+
+        xs = create_grid(self._min_x, self._max_x, step)
+        variables = create_trajectory(len(xs), self._equation_order)
+        variables[0] = self._borders
+        variables_for_2step = variables[0].copy()
+        stage_matrix, stage_vector = self._create_stage_operators(step)
+        stage_matrix_for_2step, stage_vector_for_2step = self._create_stage_operators(2 * step)
+        stage_shape = len(self.WEIGHTS), self._equation_order
+        weights = step * self.WEIGHTS
+        weights_for_2step = 2 * step * self.WEIGHTS
+        accuracy = 0
+        number_of_segments = len(xs) - 1
+        check_interval = self._progress.start(number_of_segments, xs, variables)
+        for index in range(number_of_segments):
+            variables_for_x = variables[index]
+            stages = (stage_matrix.dot(variables_for_x) + stage_vector).reshape(stage_shape)
+            variables[index + 1] = variables_for_x + weights.dot(stages)
+            if index % 2:
+                stages = (stage_matrix_for_2step.dot(variables_for_2step) + stage_vector_for_2step).reshape(stage_shape)
+                variables_for_2step = variables_for_2step + weights_for_2step.dot(stages)
+                accuracy = max(accuracy, abs(variables[index + 1, 0] - variables_for_2step[0]) / 15)
+                if accuracy > self._accuracy:
+                    self._count_steps(index + 1 + (index + 1) // 2)
+                    return xs[:index + 2], variables[:index + 2], accuracy
+            if index % check_interval == 0:
+                self._progress.update(index + 1)
+        self._count_steps(number_of_segments + number_of_segments // 2)
+        return xs, variables, accuracy
+
+    def solve(self) -> Tuple[int, float, np.ndarray, np.ndarray]:
+        """
+        Method solves equation.
+        :return: iteration number, accuracy of calculation and solution.
+        """
+
+        self._iteration_number += 1
+        self._step /= 2
+        self._calculation_for_step_started(self._iteration_number, self._step)
+        xs, variables, accuracy = self._solve_in_lockstep(self._step)
+        return self._iteration_number, accuracy, xs, variables
@@ -0,0 +1,116 @@
+"""
+File with classes to collect metrics of calculation and to profile it.
+"""
+
+import cProfile
+import os
+import tracemalloc
+from datetime import datetime
+from typing import Any, Dict, List
+
+
+class CalculationMetrics:
+    """
+    Class with metrics of one calculation. Steps and evaluations of right part
+    of system y' = A y + b are counted by solvers, steps of iterations and of
+    passes for basis solutions of superposition are added.
+    """
+
+    def __init__(self):
+        self.calculation_time: float = 0
+        self.emission_time: float = 0
+        self.evaluations: int = 0
+        self.iteration_times: List[float] = []
+        self.profile_file_names: List[str] = []
+        self.steps: int = 0
+        self.trajectory_memory: int = 0
+
+    def __str__(self) -> str:
+        iteration_times = ", ".join(f"{iteration_time:.3f}" for iteration_time in self.iteration_times)
+        return (f"steps: {self.steps}, RHS evaluations: {self.evaluations}, iteration times: [{iteration_times}] s, "
+                f"math time: {self.math_time:.3f} s, emission time: {self.emission_time:.3f} s, trajectory memory: "
+                f"{self.trajectory_memory / 1024:.1f} KB")
+
+    @property
+    def math_time(self) -> float:
+        """
+        :return: time of calculation without time of emission of results and
+        progress.
+        """
+
+        return max(self.calculation_time - self.emission_time, 0.0)
+
+    def add_iteration(self, iteration_time: float, steps: int, evaluations: int):
+        """
+        Method adds metrics of iteration.
+        :param iteration_time: wall time of iteration in seconds;
+        :param steps: number of steps in iteration;
+        :param evaluations: number of evaluations of right part in iteration.
+        """
+
+        self.iteration_times.append(iteration_time)
+        self.add_steps(steps, evaluations)
+
+    def add_steps(self, steps: int, evaluations: int):
+        """
+        Method adds steps that were made not in iteration.
+        :param steps: number of steps;
+        :param evaluations: number of evaluations of right part.
+        """
+
+        self.steps += steps
+        self.evaluations += evaluations
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Method returns metrics as dictionary, for example to save them to JSON.
+        :return: dictionary with metrics.
+        """
+
+        return {"calculation_time": self.calculation_time, "emission_time": self.emission_time,
+                "math_time": self.math_time, "evaluations": self.evaluations,
+                "iteration_times": list(self.iteration_times), "steps": self.steps,
+                "trajectory_memory": self.trajectory_memory, "profile_file_names": list(self.profile_file_names)}
+
+
+class Profiler:
+    """
+    Class to profile calculation by cProfile and tracemalloc. Profiler is used
+    as context manager, on exit statistics of cProfile are dumped to prof file
+    that can be read by pstats module, and largest allocations are written to
+    text file.
+    """
+
+    NUMBER_OF_ALLOCATIONS: int = 30
+
+    def __init__(self, dir_name: str):
+        """
+        :param dir_name: directory for files with statistics.
+        """
+
+        self._profile: cProfile.Profile = cProfile.Profile()
+        self._started_tracing: bool = False
+        prefix = os.path.join(dir_name, datetime.now().strftime("profile %Y-%m-%d %H-%M-%S-%f"))
+        self.file_names: List[str] = [prefix + ".prof", prefix + " memory.txt"]
+
+    def __enter__(self) -> "Profiler":
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        elif hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        self._profile.enable()
+        return self
+
+    def __exit__(self, *args):
+        self._profile.disable()
+        snapshot = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+        if self._started_tracing:
+            tracemalloc.stop()
+        os.makedirs(os.path.dirname(self.file_names[0]) or ".", exist_ok=True)
+        self._profile.dump_stats(self.file_names[0])
+        with open(self.file_names[1], "w", encoding="utf-8") as file:
+            file.write(f"Peak traced memory: {peak} B\n")
+            for statistic in snapshot.statistics("lineno")[:self.NUMBER_OF_ALLOCATIONS]:
+                file.write(f"{statistic}\n")
@@ -0,0 +1,197 @@
+"""
+File with solver to solve differential equation by Parareal method.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing.managers import SyncManager
+from threading import Event
+from typing import List, Optional, Tuple
+import numpy as np
+from solution.companion import create_grid
+from solution.implicit import Rosenbrock
+from solution.progress import CalculationStopped, Progress
+from solution.trajectory import create_trajectory
+from solution.vectorized_runge_kutta import VectorizedRungeKutta
+
+
+def integrate_slice(stage_matrix: np.ndarray, stage_vector: np.ndarray, weights: np.ndarray, variables: np.ndarray,
+                    number_of_steps: int, stop_event: Event = None) -> Optional[np.ndarray]:
+    """
+    Function integrates equation on slice of segment by Runge-Kutta method.
+    Function is executed in worker process.
+    :param stage_matrix: stacked matrix of stages of method;
+    :param stage_vector: stacked vector of stages of method;
+    :param weights: weights of stages multiplied by step;
+    :param variables: solution at start of slice;
+    :param number_of_steps: number of steps in slice;
+    :param stop_event: event shared between processes that stops integration.
+    :return: solution in all points of slice or None if integration was
+    stopped.
+    """
+
+    stage_shape = len(weights), len(variables)
+    trajectory = np.empty((number_of_steps + 1, len(variables)))
+    trajectory[0] = variables
+    progress = Progress(stop_event=stop_event)
+    check_interval = progress.start(number_of_steps)
+    try:
+        for index in range(number_of_steps):
+            variables_for_x = trajectory[index]
+            stages = (stage_matrix.dot(variables_for_x) + stage_vector).reshape(stage_shape)
+            trajectory[index + 1] = variables_for_x + weights.dot(stages)
+            if index % check_interval == 0:
+                progress.update(index + 1)
+    except CalculationStopped:
+        return None
+    return trajectory
+
+
+class Parareal(Rosenbrock):
+    """
+    Class to solve differential equation by Parareal method. Segment is split
+    into slices. Cheap coarse propagator gives solution at starts of slices,
+    then slices are integrated by Runge-Kutta method with given step in worker
+    processes at the same time, and starts of slices are corrected until they
+    agree with required accuracy. Coarse propagator makes few steps of
+    L-stable Rosenbrock method, so it is stable for long slices. Start of
+    slice with index k is exact after k iterations, so number of iterations
+    is not greater than number of slices. With one worker process equation is
+    solved by serial Runge-Kutta method, since iterations would only add work.
+    """
+
+    COARSE_STEPS_PER_SLICE: int = 4
+    MIN_NUMBER_OF_SLICES: int = 2
+    POLL_INTERVAL: float = 0.1
+
+    def __init__(self):
+        super().__init__()
+        self._executor: ProcessPoolExecutor = None
+        self._manager: SyncManager = None
+        self._number_of_workers: int = 1
+
+    def _get_slices(self, number_of_segments: int) -> List[Tuple[int, int]]:
+        """
+        Method splits steps of segment into slices.
+        :param number_of_segments: number of steps in segment.
+        :return: list with indices of first and last points of slices.
+        """
+
+        number_of_slices = min(max(self._number_of_workers, self.MIN_NUMBER_OF_SLICES), number_of_segments)
+        bounds = np.linspace(0, number_of_segments, number_of_slices + 1).round().astype(int).tolist()
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    def _integrate_fine(self, step: float, starts: List[np.ndarray], slices: List[Tuple[int, int]],
+                        indices: List[int]) -> List[np.ndarray]:
+        """
+        Method integrates slices with given step in worker processes. Futures
+        are polled so that stop of calculation is noticed, then slices that
+        were not started are cancelled and slices that are being integrated
+        are stopped by event.
+        :param step: step;
+        :param starts: solutions at starts of slices;
+        :param slices: indices of first and last points of slices;
+        :param indices: indices of slices to integrate.
+        :return: solutions in all points of given slices.
+        """
+
+        stage_matrix, stage_vector = self._create_stage_operators(step)
+        weights = step * self.WEIGHTS
+        numbers_of_steps = [slices[index][1] - slices[index][0] for index in indices]
+        if self._executor is None:
+            context = multiprocessing.get_context("spawn")
+            self._executor = ProcessPoolExecutor(self._number_of_workers, mp_context=context)
+            self._manager = context.Manager()
+        stop_event = self._manager.Event()
+        futures = [self._executor.submit(integrate_slice, stage_matrix, stage_vector, weights, starts[index],
+                                         number_of_steps, stop_event)
+                   for index, number_of_steps in zip(indices, numbers_of_steps)]
+        trajectories = []
+        self._progress.start(len(futures))
+        try:
+            for future in futures:
+                while not wait([future], self.POLL_INTERVAL).done:
+                    self._progress.update(len(trajectories))
+                trajectories.append(future.result())
+                self._progress.update(len(trajectories))
+        finally:
+            for future in futures:
+                future.cancel()
+            stop_event.set()
+        self._count_steps(sum(numbers_of_steps), len(self.WEIGHTS))
+        return trajectories
+
+    def _propagate_coarse(self, variables: np.ndarray, length: float) -> np.ndarray:
+        """
+        Method calculates solution at end of slice by coarse propagator, which
+        is Rosenbrock method with few steps on slice.
+        :param variables: solution at start of slice;
+        :param length: length of slice.
+        :return: solution at end of slice.
+        """
+
+        step = length / self.COARSE_STEPS_PER_SLICE
+        for _ in range(self.COARSE_STEPS_PER_SLICE):
+            variables = self._calculate_rosenbrock_step(variables, step)
+        self._count_steps(self.COARSE_STEPS_PER_SLICE)
+        return variables
+
+    def _solve_for_step(self, step: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Method solves equation for given step by Parareal iterations or by
+        serial Runge-Kutta method if there is one worker process.
+        :param step: step.
+        :return: solution.
+        """
+
+        if self._number_of_workers == 1:
+            return VectorizedRungeKutta._solve_for_step(self, step)
+        xs = create_grid(self._min_x, self._max_x, step)
+        slices = self._get_slices(len(xs) - 1)
+        lengths = [xs[end] - xs[start] for start, end in slices]
+        starts = [np.array(self._borders, dtype=float)]
+        coarse_ends = []
+        for length in lengths:
+            coarse_ends.append(self._propagate_coarse(starts[-1], length))
+            starts.append(coarse_ends[-1])
+        trajectories = [None] * len(slices)
+        indices = list(range(len(slices)))
+        for _ in range(len(slices)):
+            for index, trajectory in zip(indices, self._integrate_fine(step, starts, slices, indices)):
+                trajectories[index] = trajectory
+            new_starts = [starts[0]]
+            new_coarse_ends = []
+            for index, length in enumerate(lengths):
+                new_coarse_ends.append(self._propagate_coarse(new_starts[-1], length))
+                new_starts.append(new_coarse_ends[-1] + trajectories[index][-1] - coarse_ends[index])
+            indices = [index for index in range(1, len(slices))
+                       if np.max(np.abs(new_starts[index] - starts[index])) > self._accuracy]
+            starts, coarse_ends = new_starts, new_coarse_ends
+            if not indices:
+                break
+        variables = create_trajectory(len(xs), self._equation_order)
+        for (start, end), trajectory in zip(slices, trajectories):
+            variables[start:end + 1] = trajectory
+        return xs, variables
+
+    def set_number_of_workers(self, number_of_workers: int):
+        """
+        Method sets number of worker processes to integrate slices.
+        :param number_of_workers: number of worker processes.
+        """
+
+        if number_of_workers != self._number_of_workers:
+            self.shutdown_workers()
+            self._number_of_workers = number_of_workers
+
+    def shutdown_workers(self):
+        """
+        Method stops worker processes.
+        """
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
@@ -0,0 +1,149 @@
+"""
+File with class to report progress of integration and to stop it.
+"""
+
+import math
+import time
+from threading import Event
+from typing import Callable, Sequence
+import numpy as np
+
+
+class CalculationStopped(Exception):
+    """
+    Exception is raised in integration loop when calculation was stopped.
+    """
+
+
+class Progress:
+    """
+    Class to report progress of integration not more often than given rate.
+    Integration loops call update method at most NUMBER_OF_CHECKS times per
+    pass, so that the loops also check cheaply whether calculation was stopped.
+    If integration loop gives its arrays of solution then points calculated
+    since previous report are also reported as thinned chunks. Calculation in
+    worker process can be stopped by event shared between processes, event is
+    checked not more often than progress is reported.
+    """
+
+    MAX_NUMBER_OF_POINTS: int = 500
+    MAX_RATE: float = 30
+    NUMBER_OF_CHECKS: int = 1000
+
+    def __init__(self, callback: Callable[[float, float, float], None] = None, max_rate: float = MAX_RATE,
+                 chunk_callback: Callable[[np.ndarray, np.ndarray], None] = None,
+                 max_number_of_points: int = MAX_NUMBER_OF_POINTS, stop_event: Event = None):
+        """
+        :param callback: function to call with fraction of done work, number of
+        steps per second and estimated time to finish pass in seconds;
+        :param max_rate: max number of calls of callbacks per second;
+        :param chunk_callback: function to call with x coordinates and solution
+        in points calculated since previous call;
+        :param max_number_of_points: max number of points reported in chunks
+        during one pass;
+        :param stop_event: event that stops calculation when it is set, for
+        example event of multiprocessing manager.
+        """
+
+        self._callback: Callable[[float, float, float], None] = callback
+        self._chunk_callback: Callable[[np.ndarray, np.ndarray], None] = chunk_callback
+        self._interval: float = 1 / max_rate
+        self._max_number_of_points: int = max_number_of_points
+        self._next_index: int = 0
+        self._next_time: float = 0
+        self._start_time: float = 0
+        self._stop_event: Event = stop_event
+        self._stopped: bool = False
+        self._stride: int = 1
+        self._total: float = 1
+        self._variables: Sequence = None
+        self._xs: Sequence = None
+
+    @property
+    def stopped(self) -> bool:
+        """
+        :return: True if calculation was stopped.
+        """
+
+        return self._stopped
+
+    def _report_chunk(self, done: int):
+        """
+        Method reports thinned points of solution calculated since previous
+        report.
+        :param done: number of calculated points.
+        """
+
+        if self._next_index >= done:
+            return
+        xs = np.asarray(self._xs[self._next_index:done:self._stride])
+        variables = np.asarray(self._variables[self._next_index:done:self._stride])
+        self._next_index += len(xs) * self._stride
+        self._chunk_callback(xs, variables)
+
+    def reset(self):
+        """
+        Method allows calculation after it was stopped.
+        """
+
+        self._stopped = False
+
+    def set_chunk_callback(self, chunk_callback: Callable[[np.ndarray, np.ndarray], None]):
+        """
+        Method sets function to report chunks of solution.
+        :param chunk_callback: function to call with x coordinates and solution
+        in points calculated since previous call, if None then chunks are not
+        reported.
+        """
+
+        self._chunk_callback = chunk_callback
+
+    def start(self, total: float, xs: Sequence = None, variables: Sequence = None) -> int:
+        """
+        Method starts new pass of integration.
+        :param total: amount of work in pass, for example number of steps;
+        :param xs: x coordinates of solution that are being calculated;
+        :param variables: solution that is being calculated. Points of solution
+        are reported in chunks only if total is number of steps, so that done
+        work is number of calculated points.
+        :return: number of steps between calls of update method.
+        """
+
+        self._start_time = time.monotonic()
+        self._next_time = self._start_time + self._interval
+        self._total = total
+        self._xs, self._variables = xs, variables
+        self._next_index = 0
+        self._stride = max(1, math.ceil(total / self._max_number_of_points))
+        return max(1, int(total) // self.NUMBER_OF_CHECKS)
+
+    def stop(self):
+        """
+        Method stops calculation. It can be called from any thread.
+        """
+
+        self._stopped = True
+
+    def update(self, done: float, number_of_steps: int = None):
+        """
+        Method reports progress of pass if enough time passed since last report.
+        :param done: amount of done work;
+        :param number_of_steps: number of done steps if amount of work is not
+        measured in steps.
+        """
+
+        if self._stopped:
+            raise CalculationStopped()
+        current_time = time.monotonic()
+        if current_time < self._next_time:
+            return
+        self._next_time = current_time + self._interval
+        if self._stop_event is not None and self._stop_event.is_set():
+            self.stop()
+            raise CalculationStopped()
+        if self._callback is not None:
+            speed = (done if number_of_steps is None else number_of_steps) / (current_time - self._start_time)
+            time_left = (self._total - done) * (current_time - self._start_time) / done if done else 0.0
+            self._callback(min(done / self._total, 1.0), speed, time_left)
+        if self._chunk_callback is not None and self._xs is not None:
+            self._report_chunk(int(done))
@@ -0,0 +1,135 @@
+"""
+File with solver to solve differential equation by Runge-Kutta method using
+precomputed propagator of one step.
+"""
+
+from typing import Callable, List, Tuple
+import numpy as np
+from solution.companion import create_grid
+from solution.progress import Progress
+from solution.trajectory import create_trajectory
+from solution.vectorized_runge_kutta import VectorizedRungeKutta
+
+
+class LinearPropagator(VectorizedRungeKutta):
+    """
+    Class to solve differential equation by Runge-Kutta method. For linear
+    equation with constant coefficients one step of method is affine map
+    y_(k+1) = P y_k + c, where P and c depend only on step. Map is written as
+    matrix G = [[P, c], [0, 1]] acting on vector (y, 1), so that k steps are
+    calculated as G^k.
+    """
+
+    BLOCK_SIZE: int = 128
+    EVALUATIONS_PER_STEP: int = 1
+
+    def __init__(self):
+        super().__init__()
+        self._propagator: np.ndarray = None
+        self._propagator_step: float = None
+
+    def _create_block_operators(self, step: float, number_of_steps: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Method creates operators that give solution in block of consecutive
+        points from solution in first point of block.
+        :param step: step;
+        :param number_of_steps: number of steps in block.
+        :return: stacked matrices P^j and vectors c_j for j = 1, ..., number of
+        steps.
+        """
+
+        propagator = self.get_propagator(step)
+        powers = np.empty((number_of_steps, *propagator.shape))
+        powers[0] = propagator
+        for index in range(1, number_of_steps):
+            powers[index] = powers[index - 1].dot(propagator)
+        matrices = powers[:, :-1, :-1].reshape(-1, self._equation_order)
+        vectors = powers[:, :-1, -1]
+        return matrices, vectors
+
+    def _set_initial_data(self, borders: List[float], free_argument: float):
+        """
+        Method changes values of border equations and free argument of equation.
+        :param borders: values of border equations;
+        :param free_argument: free argument of equation.
+        """
+
+        super()._set_initial_data(borders, free_argument)
+        self._propagator = None
+        self._propagator_step = None
+
+    def _solve_for_step(self, step: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Method solves equation for given step. Solution is calculated by blocks
+        of points, every block is one matrix-vector product.
+        :param step: step.
+        :return: solution.
+        """
+
+        xs = create_grid(self._min_x, self._max_x, step)
+        variables = create_trajectory(len(xs), self._equation_order)
+        variables[0] = self._borders
+        block_size = min(self.BLOCK_SIZE, len(xs) - 1)
+        matrices, vectors = self._create_block_operators(step, block_size)
+        number_of_segments = len(xs) - 1
+        self._progress.start(number_of_segments, xs, variables)
+        for start in range(0, number_of_segments, block_size):
+            number = min(block_size, number_of_segments - start)
+            block = matrices[:number * self._equation_order].dot(variables[start])
+            variables[start + 1:start + number + 1] = block.reshape(number, self._equation_order) + vectors[:number]
+            self._progress.update(start + number)
+        self._count_steps(number_of_segments)
+        return xs, variables
+
+    def get_propagator(self, step: float) -> np.ndarray:
+        """
+        Method returns matrix G of one step of Runge-Kutta method. Matrix is
+        calculated once for every step.
+        :param step: step.
+        :return: matrix G = [[P, c], [0, 1]].
+        """
+
+        if self._propagator is None or self._propagator_step != step:
+            stage_matrix, stage_vector = self._create_stage_operators(step)
+            stage_shape = len(self.WEIGHTS), self._equation_order
+            weights = step * self.WEIGHTS
+            propagator = np.eye(self._equation_order + 1)
+            propagator[:-1, :-1] += np.tensordot(weights, stage_matrix.reshape(*stage_shape, -1), axes=1)
+            propagator[:-1, -1] = weights.dot(stage_vector.reshape(stage_shape))
+            self._propagator = propagator
+            self._propagator_step = step
+        return self._propagator
+
+    def propagate(self, variables: np.ndarray, step: float, number_of_steps: int) -> np.ndarray:
+        """
+        Method calculates solution after given number of steps of Runge-Kutta
+        method. Power of propagator is found by repeated squaring, so it takes
+        O(log(number_of_steps)) matrix products.
+        :param variables: solution in start point;
+        :param step: step;
+        :param number_of_steps: number of steps.
+        :return: solution after given number of steps.
+        """
+
+        power = np.linalg.matrix_power(self.get_propagator(step), number_of_steps)
+        return power[:-1, :-1].dot(variables) + power[:-1, -1]
+
+    def set_data(self, coefficients: List[float], free_argument: float, borders: List[float], limits: Tuple[int],
+                 progress: Progress = None,
+                 calculation_for_step_started: Callable[[int, float], None] = None):
+        """
+        Method sets new params for equation to solve.
+        :param coefficients: coefficients of equation;
+        :param free_argument: free argument of equation;
+        :param borders: values of border equations;
+        :param limits: segment in which to find solution;
+        :param progress: object to report progress of integration and to stop
+        it;
+        :param calculation_for_step_started: function to call when integration
+        of equation with given step was started.
+        """
+
+        super().set_data(coefficients, free_argument, borders, limits, progress,
+                         calculation_for_step_started)
+        self._propagator = None
+        self._propagator_step = None
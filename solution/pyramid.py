@@ -0,0 +1,72 @@
+"""
+File with multi-resolution index of solution to show any part of large
+solution with bounded number of points.
+"""
+
+from typing import List, Tuple
+import numpy as np
+
+
+class MinMaxPyramid:
+    """
+    Class with levels of min and max values of solution. First level has
+    buckets of FIRST_BUCKET_SIZE points of solution, every next level has twice
+    fewer buckets than previous one. Window of solution is taken from the
+    finest level that has not more buckets in window than required number of
+    points.
+    """
+
+    FIRST_BUCKET_SIZE: int = 8
+    MIN_NUMBER_OF_BUCKETS: int = 256
+
+    def __init__(self, xs: np.ndarray, ys: np.ndarray, min_number_of_buckets: int = MIN_NUMBER_OF_BUCKETS):
+        """
+        :param xs: x coordinates;
+        :param ys: array with values of y and its derivatives in rows;
+        :param min_number_of_buckets: number of buckets in coarsest level.
+        """
+
+        self._levels: List[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = []
+        self._xs: np.ndarray = xs
+        self._ys: np.ndarray = ys
+        starts, ends, mins, maxs = xs, xs, ys, ys
+        bucket_size = self.FIRST_BUCKET_SIZE
+        while len(starts) >= bucket_size * min_number_of_buckets:
+            indices = np.arange(0, len(starts), bucket_size)
+            starts, ends = starts[indices], ends[np.minimum(indices + bucket_size, len(ends)) - 1]
+            mins, maxs = np.fmin.reduceat(mins, indices, axis=0), np.fmax.reduceat(maxs, indices, axis=0)
+            self._levels.append((starts, ends, mins, maxs))
+            bucket_size = 2
+
+    @property
+    def nbytes(self) -> int:
+        """
+        :return: memory used by levels in bytes.
+        """
+
+        return sum(array.nbytes for level in self._levels for array in level)
+
+    def get_window(self, x_min: float, x_max: float, number_of_points: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Method returns part of solution between given x coordinates. If there
+        are more points than required, min and max values of buckets are
+        returned at starts and ends of buckets. One point or bucket is added on
+        both sides of window, so that lines reach borders of window.
+        :param x_min: left border of window;
+        :param x_max: right border of window;
+        :param number_of_points: max number of points.
+        :return: x coordinates and values in window.
+        """
+
+        start = max(int(np.searchsorted(self._xs, x_min, side="left")) - 1, 0)
+        stop = int(np.searchsorted(self._xs, x_max, side="right")) + 1
+        if stop - start <= number_of_points or not self._levels:
+            return self._xs[start:stop], self._ys[start:stop]
+        for starts, ends, mins, maxs in self._levels:
+            start = max(int(np.searchsorted(ends, x_min, side="left")) - 1, 0)
+            stop = int(np.searchsorted(starts, x_max, side="right")) + 1
+            if 2 * (stop - start) <= number_of_points:
+                break
+        xs = np.column_stack((starts[start:stop], ends[start:stop])).ravel()
+        ys = np.stack((mins[start:stop], maxs[start:stop]), axis=1)
+        return xs, ys.reshape(len(xs), *self._ys.shape[1:])
@@ -0,0 +1,38 @@
+"""
+File with function to generate code of right part of system of first order
+equations for linear differential equation with constant coefficients.
+"""
+
+from functools import lru_cache
+from typing import Callable, List, Tuple
+
+MAX_NUMBER_OF_FUNCTIONS: int = 128
+
+
+@lru_cache(maxsize=MAX_NUMBER_OF_FUNCTIONS)
+def create_right_part(coefficients: Tuple[float, ...]) -> Callable[[List[float], float], List[float]]:
+    """
+    Function generates and compiles right part of system y' = f(y) for vector
+    of variables y = (y, dy/dx, ..., dy^(n-1)/dx^(n-1)). Derivatives of all
+    variables except the last one are the next variables, derivative of the
+    last variable is free argument minus sum of variables with coefficients
+    divided by coefficient of highest derivative. Zero terms are dropped and
+    divisions are done once at generation. Functions are cached by tuple of
+    coefficients.
+    :param coefficients: coefficients of equation, from y to highest
+    derivative.
+    :return: function of variables and free argument that returns list of
+    derivatives of variables.
+    """
+
+    equation_order = len(coefficients) - 1
+    names = [f"y_{index}" for index in range(equation_order)]
+    terms = [f"{float(coefficient / coefficients[-1])!r} * {name}"
+             for coefficient, name in zip(coefficients[:-1], names) if coefficient != 0]
+    highest_derivative = f"free_argument - ({' + '.join(terms)})" if terms else "free_argument"
+    source = (f"def right_part(variables, free_argument):\n"
+              f"    {', '.join(names)}, = variables\n"
+              f"    return [{', '.join(names[1:] + [highest_derivative])}]\n")
+    namespace = {}
+    exec(compile(source, f"<right part {coefficients}>", "exec"), namespace)
+    return namespace["right_part"]
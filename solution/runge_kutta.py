@@ -3,8 +3,12 @@ File with solver to solve differential equation by Runge-Kutta method.
 """
 
 import math
-from typing import List, Tuple
-from PyQt5.QtCore import pyqtSignal
+from typing import Callable, List, Tuple
+import numpy as np
+from solution.companion import create_grid
+from solution.progress import Progress
+from solution.right_part import create_right_part
+from solution.trajectory import create_trajectory
 
 
 class RungeKutta:
@@ -13,41 +17,65 @@ class RungeKutta:
     """
 
     INITIAL_STEP: float = 0.1
+    EVALUATIONS_PER_STEP: int = 4
+    FIXED_STEP: bool = True
 
     def __init__(self):
+        self._accuracy: float = None
         self._borders: List[float] = []
-        self._calculation_for_step_started_signal: pyqtSignal = None
+        self._calculation_for_step_started: Callable[[int, float], None] = self._do_nothing
         self._coefficients: List[float] = []
         self._equation_order: int = None
         self._free_argument: float = None
         self._iteration_number: int = 1
         self._max_x: int = None
         self._min_x: int = None
-        self._segment_done_signal: pyqtSignal = None
+        self._number_of_evaluations: int = 0
+        self._number_of_steps: int = 0
+        self._progress: Progress = Progress()
+        self._right_part: Callable[[List[float], float], List[float]] = None
         self._step: float = self.INITIAL_STEP
         self._variables: List[List[float]] = []
 
-    def _calculate_k_1(self, variables: List[List[float]]) -> List[float]:
-        return [self._function_for_variable(index_of_variable, variables[-1]) for index_of_variable in
-                range(len(variables[-1]))]
+    @property
+    def number_of_evaluations(self) -> int:
+        """
+        :return: number of evaluations of right part of system y' = A y + b
+        made by solver since it was created.
+        """
 
-    def _calculate_k_2(self, step: float, k_1: List[float], variables: List[List[float]]) -> List[float]:
-        variables_for_x = [variable + k_1[index_of_variable] * step / 2 for index_of_variable, variable in
-                           enumerate(variables[-1])]
-        return [self._function_for_variable(index_of_variable, variables_for_x) for index_of_variable in
-                range(len(variables[-1]))]
+        return self._number_of_evaluations
 
-    def _calculate_k_3(self, step: float, k_2: List[float], variables: List[List[float]]) -> List[float]:
-        variables_for_x = [variable + k_2[index_of_variable] * step / 2 for index_of_variable, variable in
-                           enumerate(variables[-1])]
-        return [self._function_for_variable(index_of_variable, variables_for_x) for index_of_variable in
-                range(len(variables[-1]))]
+    @property
+    def number_of_steps(self) -> int:
+        """
+        :return: number of steps made by solver since it was created.
+        """
 
-    def _calculate_k_4(self, step: float, k_3: List[float], variables: List[List[float]]) -> List[float]:
-        variables_for_x = [variable + k_3[index_of_variable] * step for index_of_variable, variable in
-                           enumerate(variables[-1])]
-        return [self._function_for_variable(index_of_variable, variables_for_x) for index_of_variable in
-                range(len(variables[-1]))]
+        return self._number_of_steps
+
+    @property
+    def step(self) -> float:
+        """
+        :return: step of last iteration.
+        """
+
+        return self._step
+
+    def _calculate_k_1(self, variables: List[float]) -> List[float]:
+        return self._right_part(variables, self._free_argument)
+
+    def _calculate_k_2(self, step: float, k_1: List[float], variables: List[float]) -> List[float]:
+        variables_for_x = [variable + k * step / 2 for variable, k in zip(variables, k_1)]
+        return self._right_part(variables_for_x, self._free_argument)
+
+    def _calculate_k_3(self, step: float, k_2: List[float], variables: List[float]) -> List[float]:
+        variables_for_x = [variable + k * step / 2 for variable, k in zip(variables, k_2)]
+        return self._right_part(variables_for_x, self._free_argument)
+
+    def _calculate_k_4(self, step: float, k_3: List[float], variables: List[float]) -> List[float]:
+        variables_for_x = [variable + k * step for variable, k in zip(variables, k_3)]
+        return self._right_part(variables_for_x, self._free_argument)
 
     @staticmethod
     def _check_accuracy(variables_for_step: List[List[float]], variables_for_2step: List[List[float]]) -> float:
@@ -67,70 +95,148 @@ class RungeKutta:
                 max_difference = accuracy
         return max_difference
 
-    def _function_for_highest_derivative(self, variables: List[float]) -> float:
-        return self._free_argument - sum([self._coefficients[index] * variable for index, variable in
-                                          enumerate(variables)]) / self._coefficients[-1]
+    def _count_steps(self, number_of_steps: int, evaluations_per_step: int = None):
+        """
+        Method adds steps made by solver to counters of steps and evaluations
+        of right part.
+        :param number_of_steps: number of steps;
+        :param evaluations_per_step: number of evaluations of right part per
+        step, by default EVALUATIONS_PER_STEP.
+        """
+
+        if evaluations_per_step is None:
+            evaluations_per_step = self.EVALUATIONS_PER_STEP
+        self._number_of_steps += number_of_steps
+        self._number_of_evaluations += number_of_steps * evaluations_per_step
 
     @staticmethod
-    def _function_for_rest_derivatives(index_of_variable: int, variables: List[float]) -> float:
-        return variables[index_of_variable + 1]
+    def _do_nothing(*args):
+        """
+        Method is called instead of progress functions that were not set.
+        """
+
+    def _set_initial_data(self, borders: List[float], free_argument: float):
+        """
+        Method changes values of border equations and free argument of equation.
+        :param borders: values of border equations;
+        :param free_argument: free argument of equation.
+        """
 
-    def _function_for_variable(self, index_of_variable: int, variables: List[float]) -> float:
-        if index_of_variable == self._equation_order - 1:
-            return self._function_for_highest_derivative(variables)
-        return self._function_for_rest_derivatives(index_of_variable, variables)
+        self._borders = borders
+        self._free_argument = free_argument
 
-    def _solve_for_step(self, step: float) -> Tuple[List[float], List[List[float]]]:
+    def _solve_for_step(self, step: float) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Method solves equation for given step.
+        Method solves equation for given step. Solution is written to
+        preallocated array.
         :param step: step.
         :return: solution.
         """
 
-        x = self._min_x
-        variables = [self._borders[:]]
-        xs = [x]
-        progress = 0
-        number_of_segments = math.ceil((self._max_x - self._min_x) / self._step) + 1
-        while x <= self._max_x:
-            k_1 = self._calculate_k_1(variables)
-            k_2 = self._calculate_k_2(step, k_1, variables)
-            k_3 = self._calculate_k_3(step, k_2, variables)
-            k_4 = self._calculate_k_4(step, k_3, variables)
+        xs = create_grid(self._min_x, self._max_x, step)
+        variables = create_trajectory(len(xs), self._equation_order)
+        variables_for_x = list(self._borders)
+        variables[0] = variables_for_x
+        check_interval = self._progress.start(len(xs) - 1, xs, variables)
+        for index_of_point in range(1, len(xs)):
+            k_1 = self._calculate_k_1(variables_for_x)
+            k_2 = self._calculate_k_2(step, k_1, variables_for_x)
+            k_3 = self._calculate_k_3(step, k_2, variables_for_x)
+            k_4 = self._calculate_k_4(step, k_3, variables_for_x)
             variables_for_x = [variable + 1 / 6 * step * (k_1[index] + 2 * k_2[index] + 2 * k_3[index] + k_4[index])
-                               for index, variable in enumerate(variables[-1])]
-            variables.append(variables_for_x)
-            x += step
-            xs.append(x)
-            current_progress = round(100 * len(xs) / number_of_segments)
-            if current_progress != progress:
-                progress = current_progress
-                self._segment_done_signal.emit()
+                               for index, variable in enumerate(variables_for_x)]
+            variables[index_of_point] = variables_for_x
+            if index_of_point % check_interval == 0:
+                self._progress.update(index_of_point)
+        self._count_steps(len(xs) - 1)
         return xs, variables
 
+    def check_accuracy(self, variables_for_step: List[List[float]], variables_for_2step: List[List[float]]) -> float:
+        """
+        Method calculates accuracy of solution by Runge rule.
+        :param variables_for_step: solution for step;
+        :param variables_for_2step: solution for double step.
+        :return: accuracy of solution.
+        """
+
+        return self._check_accuracy(variables_for_step, variables_for_2step)
+
+    def set_accuracy(self, accuracy: float):
+        """
+        Method sets required accuracy of solution.
+        :param accuracy: required accuracy.
+        """
+
+        self._accuracy = accuracy
+
     def set_data(self, coefficients: List[float], free_argument: float, borders: List[float], limits: Tuple[int],
-                 segment_done_signal: pyqtSignal, calculation_for_step_started_signal: pyqtSignal):
+                 progress: Progress = None,
+                 calculation_for_step_started: Callable[[int, float], None] = None):
         """
         Method sets new params for equation to solve.
         :param coefficients: coefficients of equation;
         :param free_argument: free argument of equation;
         :param borders: values of border equations;
         :param limits: segment in which to find solution;
-        :param segment_done_signal: signal for event that equation was integrated
-        on dx segment;
-        :param calculation_for_step_started_signal: signal for event that
-        equation was integrated on all segment with given step.
+        :param progress: object to report progress of integration and to stop
+        it;
+        :param calculation_for_step_started: function to call when integration
+        of equation with given step was started.
         """
 
         self._borders = borders
-        self._calculation_for_step_started_signal = calculation_for_step_started_signal
+        self._calculation_for_step_started = calculation_for_step_started or self._do_nothing
         self._coefficients = coefficients
         self._equation_order: int = len(coefficients) - 1
         self._free_argument = free_argument
         self._iteration_number = 0
         self._min_x, self._max_x = limits
+        self._progress = progress or Progress()
+        self._right_part = create_right_part(tuple(float(coefficient) for coefficient in coefficients))
         self._step = 2 * self.INITIAL_STEP
-        self._segment_done_signal = segment_done_signal
+        self._variables = []
+
+    def set_step(self, step: float):
+        """
+        Method sets step of first iteration.
+        :param step: step.
+        """
+
+        self._step = 2 * step
+
+    def solve_for_step(self, step: float) -> Tuple[List[float], List[List[float]]]:
+        """
+        Method solves equation for given step without estimation of accuracy.
+        :param step: step.
+        :return: solution.
+        """
+
+        return self._solve_for_step(step)
+
+    def solve_for_basis(self, step: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Method solves equation for given step with unit values of border
+        equations and zero free argument, and also with zero values of border
+        equations and unit free argument. Solution of linear equation for any
+        border values and free argument is linear combination of these
+        solutions.
+        :param step: step.
+        :return: x coordinates and array of shape (number of points, order of
+        equation, order of equation + 1) with basis solutions in last axis.
+        """
+
+        borders, free_argument = self._borders, self._free_argument
+        initial_data = [(list(vector), 0) for vector in np.eye(self._equation_order)]
+        initial_data.append(([0] * self._equation_order, 1))
+        solutions = []
+        try:
+            for basis_borders, basis_free_argument in initial_data:
+                self._set_initial_data(basis_borders, basis_free_argument)
+                xs, variables = self._solve_for_step(step)
+                solutions.append(np.asarray(variables))
+        finally:
+            self._set_initial_data(borders, free_argument)
+        return np.asarray(xs), np.stack(solutions, axis=-1)
 
     def solve(self) -> Tuple[int, float, List[float], List[List[float]]]:
         """
@@ -140,9 +246,9 @@ class RungeKutta:
 
         self._iteration_number += 1
         self._step /= 2
-        self._calculation_for_step_started_signal.emit(self._iteration_number, self._step)
+        self._calculation_for_step_started(self._iteration_number, self._step)
         xs, variables = self._solve_for_step(self._step)
-        if self._variables:
+        if len(self._variables):
             accuracy = self._check_accuracy(variables, self._variables)
         else:
             accuracy = -1
@@ -1,61 +1,108 @@
 """
-File with main solver of differential equation.
+File with Qt adapter for main solver of differential equation.
 """
 
-import time
-from enum import auto, Enum
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+import numpy as np
 from PyQt5.QtCore import pyqtSignal, pyqtSlot, QObject
-from solution.runge_kutta import RungeKutta
-
-
-class SolutionMethod(Enum):
-    """
-    Class with methods of solution of differential equation.
-    """
-
-    EULER = auto()
-    RUNGE_KUTTA = auto()
+from solution.cache import SolutionCache
+from solution.core import SolutionMethod, SolverCore
 
 
 class Solver(QObject):
     """
-    Class to solve differential equation.
+    Class to solve differential equation in thread of Qt application. Events
+    of calculation are sent with signals.
     """
 
-    MAX_NUMBER_OF_POINTS: int = 500
-    MAX_NUMBER_OF_ITERATIONS: int = 10
+    cache_checked: pyqtSignal = pyqtSignal(bool)
     calculation_finished: pyqtSignal = pyqtSignal()
-    calculation_for_step_finished: pyqtSignal = pyqtSignal(list, list, float)
+    calculation_for_step_finished: pyqtSignal = pyqtSignal(object, object, float)
     calculation_for_step_started: pyqtSignal = pyqtSignal(int, float)
+    chunk_calculated: pyqtSignal = pyqtSignal(object, object)
     calculation_started: pyqtSignal = pyqtSignal(list, list)
     max_iterations_used: pyqtSignal = pyqtSignal(int)
-    segment_done: pyqtSignal = pyqtSignal()
+    metrics_collected: pyqtSignal = pyqtSignal(object)
+    progress_changed: pyqtSignal = pyqtSignal(float, float, float)
+    pyramid_built: pyqtSignal = pyqtSignal(object)
+    steps_counted: pyqtSignal = pyqtSignal(int, int)
 
     def __init__(self):
         super().__init__()
-        self.accuracy: float = -1
-        self.calculation_stopped: bool = False
-        self.runge_kutta: RungeKutta = RungeKutta()
-        self.solver: RungeKutta = None
-        self.xs: List[float] = None
-        self.ys: List[List[float]] = None
+        self.core: SolverCore = SolverCore()
+        self.core.on_cache_checked = self.cache_checked.emit
+        self.core.on_calculation_finished = self.calculation_finished.emit
+        self.core.on_calculation_for_step_finished = self.calculation_for_step_finished.emit
+        self.core.on_calculation_for_step_started = self.calculation_for_step_started.emit
+        self.core.on_calculation_started = self.calculation_started.emit
+        self.core.on_chunk_calculated = self.chunk_calculated.emit
+        self.core.on_max_iterations_used = self.max_iterations_used.emit
+        self.core.on_metrics_collected = self.metrics_collected.emit
+        self.core.on_progress_changed = self.progress_changed.emit
+        self.core.on_pyramid_built = self.pyramid_built.emit
+        self.core.on_steps_counted = self.steps_counted.emit
 
-    @staticmethod
-    def analyze_input_data(coefficients: List[float], borders: List[float]) -> Tuple[List[float], List[float]]:
+    @property
+    def cache(self) -> SolutionCache:
         """
-        Method analyzes input data of equation and determines order of equation.
-        :param coefficients: coefficients in equation;
-        :param borders: values in border equations.
-        :return: correct coefficients in equation and values in border equations.
+        :return: cache of solutions.
+        """
+
+        return self.core.cache
+
+    @property
+    def number_of_workers(self) -> int:
+        """
+        :return: number of worker processes.
+        """
+
+        return self.core.number_of_workers
+
+    @number_of_workers.setter
+    def number_of_workers(self, number_of_workers: int):
+        """
+        :param number_of_workers: number of worker processes.
+        """
+
+        self.core.number_of_workers = number_of_workers
+
+    @property
+    def profile_dir_name(self) -> Optional[str]:
+        """
+        :return: directory for statistics of profiled calculation, if None
+        then calculation is not profiled.
+        """
+
+        return self.core.profile_dir_name
+
+    @profile_dir_name.setter
+    def profile_dir_name(self, dir_name: Optional[str]):
+        """
+        :param dir_name: directory for statistics of profiled calculation, if
+        None then calculation is not profiled.
+        """
+
+        self.core.profile_dir_name = dir_name
+
+    def get_solution(self, grid: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Method returns full solution of last calculation. Method must not be
+        called while calculation is running.
+        :param grid: x coordinates in which to evaluate solution by dense
+        output, if None then solution is returned in points of integration.
+        :return: x coordinates and values of y and its derivatives.
         """
 
-        for index in range(len(coefficients) - 1, -1, -1):
-            if coefficients[index] != 0:
-                break
-            coefficients.pop(index)
-            borders.pop(index - 1)
-        return coefficients, borders
+        if grid is not None:
+            return np.asarray(grid, dtype=float), self.core.sample(grid)
+        return np.asarray(self.core.xs), np.asarray(self.core.ys)
+
+    def shutdown_workers(self):
+        """
+        Method stops worker processes.
+        """
+
+        self.core.shutdown_workers()
 
     @pyqtSlot(SolutionMethod, float, list, float, list, tuple)
     def start_calculation(self, solution_method: SolutionMethod, accuracy: float, coefficients: List[float],
@@ -70,25 +117,13 @@ class Solver(QObject):
         :param limits: segment in which to find solution.
         """
 
-        self.accuracy = accuracy
-        self.calculation_stopped = False
-        coefficients, borders = self.analyze_input_data(coefficients, borders)
-        self.calculation_started.emit(coefficients, borders)
-        if solution_method == SolutionMethod.RUNGE_KUTTA:
-            self.solver = self.runge_kutta
-        self.solver.set_data(coefficients, free_argument, borders, limits, self.segment_done,
-                             self.calculation_for_step_started)
-        while not self.calculation_stopped:
-            iteration_number, current_accuracy, self.xs, self.ys = self.solver.solve()
-            number = len(self.xs)
-            points_number = number if number < self.MAX_NUMBER_OF_POINTS else self.MAX_NUMBER_OF_POINTS
-            d_number = round(number / points_number)
-            self.calculation_for_step_finished.emit(self.xs[::d_number], self.ys[::d_number], current_accuracy)
-            if current_accuracy != -1 and current_accuracy <= self.accuracy:
-                self.calculation_finished.emit()
-                break
-            if iteration_number >= self.MAX_NUMBER_OF_ITERATIONS:
-                self.max_iterations_used.emit(iteration_number)
-                self.calculation_finished.emit()
-                break
-            time.sleep(0.2)
+        self.core.start_calculation(solution_method, accuracy, coefficients, free_argument, borders, limits)
+
+    @pyqtSlot()
+    def stop_calculation(self):
+        """
+        Slot stops calculation. Slot must be connected directly, since thread of
+        solver is busy with calculation.
+        """
+
+        self.core.stop_calculation()
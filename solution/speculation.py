@@ -0,0 +1,81 @@
+"""
+File with functions to solve differential equation for several steps at once
+in separate processes.
+"""
+
+from collections import deque
+from concurrent.futures import Executor
+from threading import Event
+from typing import Iterator, List, Optional, Tuple, Type
+import numpy as np
+from solution.progress import CalculationStopped, Progress
+from solution.runge_kutta import RungeKutta
+
+
+def solve_for_step(solver_class: Type[RungeKutta], coefficients: List[float], free_argument: float,
+                   borders: List[float], limits: Tuple[int], step: float,
+                   stop_event: Event = None) -> Optional[Tuple[np.ndarray, np.ndarray, int, int]]:
+    """
+    Function solves equation for given step. Function is executed in worker
+    process.
+    :param solver_class: class of solver;
+    :param coefficients: coefficients of equation;
+    :param free_argument: free argument of equation;
+    :param borders: values of border equations;
+    :param limits: segment in which to find solution;
+    :param step: step;
+    :param stop_event: event shared between processes that stops solution.
+    :return: x coordinates, solution, number of steps and number of
+    evaluations of right part or None if solution was stopped.
+    """
+
+    solver = solver_class()
+    solver.set_data(coefficients, free_argument, borders, limits, Progress(stop_event=stop_event))
+    try:
+        xs, variables = solver.solve_for_step(step)
+    except CalculationStopped:
+        return None
+    return np.asarray(xs), np.asarray(variables), solver.number_of_steps, solver.number_of_evaluations
+
+
+def solve_for_steps(executor: Executor, number_of_workers: int, solver_class: Type[RungeKutta],
+                    coefficients: List[float], free_argument: float, borders: List[float], limits: Tuple[int],
+                    steps: List[float],
+                    stop_event: Event = None) -> Iterator[Tuple[float, np.ndarray, np.ndarray, int, int]]:
+    """
+    Function solves equation for given steps in worker processes. Up to
+    number_of_workers steps are solved at the same time, solutions are yielded
+    in order of steps. When generator is closed, steps that were not started
+    are cancelled and steps that are being solved are stopped by event, so
+    event has to be new for every call. If event is set outside, generator
+    stops after solution that was being waited for is stopped.
+    :param executor: executor with worker processes;
+    :param number_of_workers: number of steps to solve at the same time;
+    :param solver_class: class of solver;
+    :param coefficients: coefficients of equation;
+    :param free_argument: free argument of equation;
+    :param borders: values of border equations;
+    :param limits: segment in which to find solution;
+    :param steps: steps;
+    :param stop_event: event shared between worker processes, for example
+    event of multiprocessing manager.
+    :return: step, x coordinates, solution, number of steps and number of
+    evaluations of right part for every step.
+    """
+
+    futures = deque()
+    steps_to_submit = deque(steps)
+    try:
+        for step in steps:
+            while steps_to_submit and len(futures) < number_of_workers:
+                futures.append(executor.submit(solve_for_step, solver_class, coefficients, free_argument, borders,
+                                               limits, steps_to_submit.popleft(), stop_event))
+            result = futures.popleft().result()
+            if result is None:
+                return
+            yield (step, *result)
+    finally:
+        for future in futures:
+            future.cancel()
+        if stop_event is not None:
+            stop_event.set()
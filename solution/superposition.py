@@ -0,0 +1,53 @@
+"""
+File with class to find solution of linear differential equation as
+superposition of basis solutions.
+"""
+
+from typing import Callable, List, Tuple
+import numpy as np
+
+
+class Superposition:
+    """
+    Class to find solution of linear differential equation for new values of
+    border equations and free argument. Solution is linear in these values, so
+    it is combination of basis solutions found for unit values. Basis solutions
+    are stored for two steps to estimate accuracy of combination by Runge rule.
+    """
+
+    def __init__(self, xs: np.ndarray, basis: np.ndarray, basis_for_2step: np.ndarray,
+                 check_accuracy: Callable[[np.ndarray, np.ndarray], float]):
+        """
+        :param xs: x coordinates of basis solutions for step;
+        :param basis: basis solutions for step;
+        :param basis_for_2step: basis solutions for double step;
+        :param check_accuracy: function to calculate accuracy of solution from
+        solutions for step and for double step.
+        """
+
+        self._basis: np.ndarray = basis
+        self._basis_for_2step: np.ndarray = basis_for_2step
+        self._check_accuracy: Callable[[np.ndarray, np.ndarray], float] = check_accuracy
+        self._xs: np.ndarray = xs
+
+    @property
+    def nbytes(self) -> int:
+        """
+        :return: size of stored basis solutions in bytes.
+        """
+
+        return self._xs.nbytes + self._basis.nbytes + self._basis_for_2step.nbytes
+
+    def combine(self, borders: List[float], free_argument: float) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        Method finds solution for given values of border equations and free
+        argument.
+        :param borders: values of border equations;
+        :param free_argument: free argument of equation.
+        :return: x coordinates, solution and its accuracy.
+        """
+
+        weights = np.append(np.asarray(borders, dtype=float), free_argument)
+        variables = self._basis.dot(weights)
+        accuracy = self._check_accuracy(variables, self._basis_for_2step.dot(weights))
+        return self._xs, variables, accuracy
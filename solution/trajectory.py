@@ -0,0 +1,33 @@
+"""
+File with function to allocate storage for solution of differential equation.
+"""
+
+import tempfile
+import numpy as np
+
+MAX_MEMORY_SIZE: int = 128 * 1024 ** 2
+
+
+def create_trajectory(number_of_points: int, number_of_columns: int, max_memory_size: int = MAX_MEMORY_SIZE,
+                      dir_name: str = None) -> np.ndarray:
+    """
+    Function allocates array for solution with values of y and its derivatives
+    in columns. Small solution is kept in memory in row-major order, which is
+    faster for integration loops writing whole rows. If solution is larger
+    than max_memory_size then array is mapped to temporary file in
+    column-major order, so that solution can be larger than memory and every
+    column can be read without reading other columns. Temporary file is deleted
+    when array is deleted.
+    :param number_of_points: number of points of solution;
+    :param number_of_columns: number of values in every point;
+    :param max_memory_size: max size of array in memory in bytes;
+    :param dir_name: directory for temporary file, if None then default
+    temporary directory is used.
+    :return: array for solution.
+    """
+
+    shape = number_of_points, number_of_columns
+    if number_of_points * number_of_columns * np.dtype(float).itemsize <= max_memory_size:
+        return np.empty(shape)
+    with tempfile.TemporaryFile(dir=dir_name) as file:
+        return np.memmap(file, dtype=float, mode="w+", shape=shape, order="F")
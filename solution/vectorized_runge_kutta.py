@@ -0,0 +1,111 @@
+"""
+File with solver to solve differential equation by Runge-Kutta method using
+vectorized operations over companion matrix of equation.
+"""
+
+from typing import Callable, List, Tuple
+import numpy as np
+from solution.companion import create_companion_matrix, create_free_vector, create_grid
+from solution.progress import Progress
+from solution.runge_kutta import RungeKutta
+from solution.trajectory import create_trajectory
+
+
+class VectorizedRungeKutta(RungeKutta):
+    """
+    Class to solve differential equation by Runge-Kutta method. Equation is
+    written as system y' = A y + b, so all stages of method are calculated
+    with one matrix-vector product per step.
+    """
+
+    NODES: np.ndarray = np.array([0, 1 / 2, 1 / 2, 1])
+    WEIGHTS: np.ndarray = np.array([1 / 6, 1 / 3, 1 / 3, 1 / 6])
+
+    def __init__(self):
+        super().__init__()
+        self._free_vector: np.ndarray = None
+        self._matrix: np.ndarray = None
+
+    @staticmethod
+    def _check_accuracy(variables_for_step: np.ndarray, variables_for_2step: np.ndarray) -> float:
+        """
+        Method calculates accuracy of solution.
+        :param variables_for_step: solution for step;
+        :param variables_for_2step: solution for double step.
+        :return: accuracy of solution.
+        """
+
+        values_for_step = variables_for_step[::2, 0]
+        number = min(len(values_for_step), len(variables_for_2step))
+        return float(np.max(np.abs(variables_for_2step[:number, 0] - values_for_step[:number]))) / 15
+
+    def _create_stage_operators(self, step: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Method creates operators of Runge-Kutta stages for given step. Since
+        equation is linear, every stage k_i = A (y + c_i h k_(i-1)) + b is linear
+        function of y, so all stages of step are found as K = S y + s.
+        :param step: step.
+        :return: stacked matrix S and vector s of stages.
+        """
+
+        stage_matrices = [self._matrix]
+        stage_vectors = [self._free_vector]
+        for node in self.NODES[1:]:
+            stage_matrices.append(self._matrix + node * step * self._matrix.dot(stage_matrices[-1]))
+            stage_vectors.append(self._free_vector + node * step * self._matrix.dot(stage_vectors[-1]))
+        return np.concatenate(stage_matrices), np.concatenate(stage_vectors)
+
+    def _set_initial_data(self, borders: List[float], free_argument: float):
+        """
+        Method changes values of border equations and free argument of equation.
+        :param borders: values of border equations;
+        :param free_argument: free argument of equation.
+        """
+
+        super()._set_initial_data(borders, free_argument)
+        self._free_vector = create_free_vector(self._equation_order, free_argument)
+
+    def _solve_for_step(self, step: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Method solves equation for given step.
+        :param step: step.
+        :return: solution.
+        """
+
+        xs = create_grid(self._min_x, self._max_x, step)
+        variables = create_trajectory(len(xs), self._equation_order)
+        variables[0] = self._borders
+        stage_matrix, stage_vector = self._create_stage_operators(step)
+        stage_shape = len(self.WEIGHTS), self._equation_order
+        weights = step * self.WEIGHTS
+        number_of_segments = len(xs) - 1
+        check_interval = self._progress.start(number_of_segments, xs, variables)
+        for index in range(number_of_segments):
+            variables_for_x = variables[index]
+            stages = (stage_matrix.dot(variables_for_x) + stage_vector).reshape(stage_shape)
+            variables[index + 1] = variables_for_x + weights.dot(stages)
+            if index % check_interval == 0:
+                self._progress.update(index + 1)
+        self._count_steps(number_of_segments, len(self.WEIGHTS))
+        return xs, variables
+
+    def set_data(self, coefficients: List[float], free_argument: float, borders: List[float], limits: Tuple[int],
+                 progress: Progress = None,
+                 calculation_for_step_started: Callable[[int, float], None] = None):
+        """
+        Method sets new params for equation to solve and creates companion
+        matrix of equation.
+        :param coefficients: coefficients of equation;
+        :param free_argument: free argument of equation;
+        :param borders: values of border equations;
+        :param limits: segment in which to find solution;
+        :param progress: object to report progress of integration and to stop
+        it;
+        :param calculation_for_step_started: function to call when integration
+        of equation with given step was started.
+        """
+
+        super().set_data(coefficients, free_argument, borders, limits, progress,
+                         calculation_for_step_started)
+        self._free_vector = create_free_vector(self._equation_order, free_argument)
+        self._matrix = create_companion_matrix(coefficients)